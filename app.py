@@ -7,11 +7,14 @@ reported amounts.
 """
 
 import streamlit as st
+import hashlib
 import io
-import traceback
-from typing import Optional
-import pandas as pd
+import os
+from string import Template
+from types import SimpleNamespace
+from typing import Any, Callable, Optional
 from datetime import datetime
+from streamlit.runtime.uploaded_file_manager import UploadedFile
 from extractor import extract_loan_data, ExtractedData
 from calculator import (
     calculate_interest_with_details, 
@@ -34,7 +37,6 @@ from input_validator import (
 from logging_config import (
     setup_logging,
     get_logger,
-    LoggingContext,
     log_operation,
     log_validation_result,
     log_extraction_result,
@@ -42,6 +44,85 @@ from logging_config import (
     log_error
 )
 
+# Custom CSS for professional banking appearance, kept in static/loanguard.css.
+# Streamlit 1.56+ serves app static files with their real content type, so the page
+# links the stylesheet (requires server.enableStaticServing) and the browser caches
+# it across reruns. Older releases serve .css as text/plain with nosniff, which
+# browsers refuse to apply, so there the stylesheet is inlined in a <style> block.
+_STATIC_CSS_MIN_STREAMLIT = (1, 56)
+_STYLESHEET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "loanguard.css")
+
+if tuple(int(part) for part in st.__version__.split(".")[:2]) >= _STATIC_CSS_MIN_STREAMLIT:
+    _STYLESHEET_HTML = '<link rel="stylesheet" href="app/static/loanguard.css">'
+else:
+    with open(_STYLESHEET_PATH, encoding="utf-8") as stylesheet:
+        _STYLESHEET_HTML = f"<style>\n{stylesheet.read()}</style>"
+
+_HEADER_HTML = """
+    <div class="banking-header">
+        <h1>🏦 LoanGuard</h1>
+        <p>Interest Payment Notice Validator</p>
+        <p style="font-size: 0.9rem; margin-top: 1rem; opacity: 0.8;">
+            Professional Banking Tool • Syndicated Loan Operations • Version 1.0
+        </p>
+    </div>
+    """
+
+# Section header and "awaiting upload" placeholder card markup
+_SECTION_HEADER_TMPL = Template("""
+    <div class="section-header">
+        <h3>$title</h3>
+    </div>
+    """)
+_PLACEHOLDER_TMPL = Template("""
+    <div style="background: #f8f9fa; padding: 2rem; border-radius: 10px; text-align: center; border: 2px dashed #dee2e6;">
+        <h4 style="color: #6c757d; margin-top: 0;">$title</h4>
+        <p style="color: #6c757d; margin-bottom: 0;">
+            $message
+        </p>
+    </div>
+    """)
+
+_UPLOAD_HEADER_HTML = _SECTION_HEADER_TMPL.substitute(title="📄 Upload Interest Payment Notice")
+_EXTRACTED_HEADER_HTML = _SECTION_HEADER_TMPL.substitute(title="📋 Extracted Financial Data")
+_CALCULATION_HEADER_HTML = _SECTION_HEADER_TMPL.substitute(title="🧮 Interest Calculation")
+
+# Placeholder sections shown before a file is uploaded: (section title, card title, card message)
+_PLACEHOLDERS = (
+    ("📋 Extracted Financial Data", "📄 Upload Required",
+     "Upload a PDF file to see extracted financial data here."),
+    ("🧮 Interest Calculation", "🔢 Calculation Pending",
+     "Interest calculation details will appear here after data extraction."),
+    ("🔍 Validation Results", "⏳ Validation Awaiting",
+     "Validation results will appear here after processing."),
+)
+
+# Sample PDF download names and the PDF MIME type
+_PASS_FILENAME = "sample_correct_interest_notice.pdf"
+_FAIL_FILENAME = "sample_incorrect_interest_notice.pdf"
+_PDF_MIME = "application/pdf"
+
+def _pdf_failure_reason(name: str, mime: str) -> Optional[str]:
+    """
+    Decide whether a file is a PDF from its name and MIME type.
+    
+    Args:
+        name: Uploaded file name
+        mime: Uploaded file MIME type
+        
+    Returns:
+        str or None: Why the file is not a valid PDF, or None if it is one
+    """
+    # Check file extension
+    if not name.lower().endswith('.pdf'):
+        return "Invalid extension"
+    
+    # Check MIME type
+    if mime != _PDF_MIME:
+        return f"Invalid MIME type {mime}"
+    
+    return None
+
 def validate_pdf_file(uploaded_file) -> bool:
     """
     Validate that the uploaded file is a PDF.
@@ -52,24 +133,16 @@ def validate_pdf_file(uploaded_file) -> bool:
     Returns:
         bool: True if file is valid PDF, False otherwise
     """
-    logger = get_logger()
-    
     if uploaded_file is None:
-        logger.debug("File validation failed: No file provided")
+        get_logger().debug("File validation failed: No file provided")
         return False
     
     try:
-        # Check file extension
-        if not uploaded_file.name.lower().endswith('.pdf'):
-            logger.warning(f"File validation failed: Invalid extension for {uploaded_file.name}")
-            return False
+        failure = _pdf_failure_reason(uploaded_file.name, uploaded_file.type)
         
-        # Check MIME type
-        if uploaded_file.type != 'application/pdf':
-            logger.warning(f"File validation failed: Invalid MIME type {uploaded_file.type} for {uploaded_file.name}")
+        if failure is not None:
+            get_logger().warning("File validation failed: %s for %s", failure, uploaded_file.name)
             return False
-        
-        logger.info(f"File validation passed for {uploaded_file.name}")
         return True
         
     except Exception as e:
@@ -95,363 +168,56 @@ def setup_page_config():
         # Continue execution even if page config fails
     
     # Add custom CSS for professional banking appearance
-    st.markdown("""
-    <style>
-    /* Main app styling */
-    .main .block-container {
-        padding-top: 2rem;
-        padding-bottom: 2rem;
-        max-width: 1200px;
-    }
-    
-    /* Professional color scheme */
-    :root {
-        --primary-blue: #1f4e79;
-        --secondary-blue: #2d5aa0;
-        --success-green: #28a745;
-        --warning-orange: #fd7e14;
-        --error-red: #dc3545;
-        --light-gray: #f8f9fa;
-        --dark-gray: #6c757d;
-    }
-    
-    /* Header styling */
-    .banking-header {
-        background: linear-gradient(135deg, var(--primary-blue) 0%, var(--secondary-blue) 100%);
-        color: white;
-        padding: 2rem;
-        border-radius: 15px;
-        text-align: center;
-        margin-bottom: 2rem;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-    }
-    
-    .banking-header h1 {
-        margin: 0;
-        font-size: 2.5rem;
-        font-weight: 300;
-        letter-spacing: 1px;
-    }
-    
-    .banking-header p {
-        margin: 0.5rem 0 0 0;
-        font-size: 1.2rem;
-        opacity: 0.9;
-        font-weight: 300;
-    }
-    
-    /* Section headers */
-    .section-header {
-        background: var(--light-gray);
-        padding: 1rem 1.5rem;
-        border-radius: 10px;
-        border-left: 4px solid var(--primary-blue);
-        margin: 1.5rem 0 1rem 0;
-    }
-    
-    .section-header h3 {
-        margin: 0;
-        color: var(--primary-blue);
-        font-weight: 500;
-    }
-    
-    /* Status cards */
-    .status-card {
-        padding: 2rem;
-        border-radius: 15px;
-        text-align: center;
-        margin: 1.5rem 0;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-        border: 2px solid;
-    }
-    
-    .status-card-pass {
-        background: linear-gradient(135deg, #d4edda 0%, #c3e6cb 100%);
-        border-color: var(--success-green);
-        color: #155724;
-    }
-    
-    .status-card-fail {
-        background: linear-gradient(135deg, #f8d7da 0%, #f1b0b7 100%);
-        border-color: var(--error-red);
-        color: #721c24;
-    }
-    
-    .status-card h2 {
-        margin: 0;
-        font-size: 2rem;
-        font-weight: 600;
-    }
-    
-    .status-card h3 {
-        margin: 0.5rem 0;
-        font-size: 1.3rem;
-        font-weight: 400;
-    }
-    
-    .status-card p {
-        margin: 0;
-        font-size: 1.1rem;
-        line-height: 1.4;
-    }
-    
-    /* Data tables */
-    .stDataFrame {
-        border-radius: 10px;
-        overflow: hidden;
-        box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
-    }
-    
-    /* Upload section */
-    .upload-section {
-        background: var(--light-gray);
-        padding: 2rem;
-        border-radius: 15px;
-        border: 2px dashed var(--primary-blue);
-        text-align: center;
-        margin: 1rem 0;
-    }
-    
-    /* Progress indicators */
-    .progress-step {
-        display: inline-block;
-        padding: 0.5rem 1rem;
-        margin: 0.25rem;
-        border-radius: 20px;
-        font-size: 0.9rem;
-        font-weight: 500;
-    }
-    
-    .progress-step-completed {
-        background: var(--success-green);
-        color: white;
-    }
-    
-    .progress-step-current {
-        background: var(--secondary-blue);
-        color: white;
-    }
-    
-    .progress-step-pending {
-        background: var(--light-gray);
-        color: var(--dark-gray);
-        border: 1px solid var(--dark-gray);
-    }
-    
-    /* Loading indicators */
-    .loading-container {
-        text-align: center;
-        padding: 2rem;
-    }
-    
-    .loading-text {
-        color: var(--primary-blue);
-        font-size: 1.1rem;
-        margin-top: 1rem;
-    }
-    
-    /* Buttons */
-    .stButton > button {
-        background: linear-gradient(135deg, var(--primary-blue) 0%, var(--secondary-blue) 100%);
-        color: white;
-        border: none;
-        border-radius: 8px;
-        padding: 0.5rem 2rem;
-        font-weight: 500;
-        transition: all 0.3s ease;
-    }
-    
-    .stButton > button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2);
-    }
-    
-    /* Expanders */
-    .streamlit-expanderHeader {
-        background: var(--light-gray);
-        border-radius: 8px;
-        font-weight: 500;
-    }
-    
-    /* Footer */
-    .app-footer {
-        text-align: center;
-        color: var(--dark-gray);
-        font-size: 0.9rem;
-        padding: 2rem 0;
-        border-top: 1px solid #dee2e6;
-        margin-top: 3rem;
-    }
-    
-    /* Responsive design */
-    @media (max-width: 768px) {
-        .banking-header h1 {
-            font-size: 2rem;
-        }
-        
-        .banking-header p {
-            font-size: 1rem;
-        }
-        
-        .status-card {
-            padding: 1.5rem;
-        }
-        
-        .status-card h2 {
-            font-size: 1.5rem;
-        }
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    st.markdown(_STYLESHEET_HTML, unsafe_allow_html=True)
 
 def render_header():
     """Render the professional banking header with progress indicator."""
-    st.markdown("""
-    <div class="banking-header">
-        <h1>🏦 LoanGuard</h1>
-        <p>Interest Payment Notice Validator</p>
-        <p style="font-size: 0.9rem; margin-top: 1rem; opacity: 0.8;">
-            Professional Banking Tool • Syndicated Loan Operations • Version 1.0
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
+
+
+# Progress indicator steps in display order: (step key, label)
+_STEP_ITEMS = (
+    ("upload", "📄 Upload PDF"),
+    ("extract", "🔍 Extract Data"),
+    ("calculate", "🧮 Calculate Interest"),
+    ("validate", "✅ Validate Results"),
+)
+_STEP_ORDER = tuple(step_key for step_key, _ in _STEP_ITEMS)
+_PROGRESS_WRAPPER = "<div style='text-align: center; margin: 1.5rem 0;'>{body}</div>"
+_PROGRESS_STEP = '<span class="progress-step {css_class}">{label}</span>'
+_PROGRESS_ARROW = ' <span style="color: #6c757d; margin: 0 0.5rem;">→</span> '
 
 
-def render_progress_indicator(current_step: str):
+def render_progress_indicator(current_step: str, placeholder: Optional[Any] = None):
     """
     Render progress indicator showing current step in the validation process.
     
     Args:
         current_step: Current step in process ("upload", "extract", "calculate", "validate")
+        placeholder: Optional ``st.empty()`` slot; rendering into it replaces the
+            previous indicator instead of appending another one
     """
-    steps = {
-        "upload": "📄 Upload PDF",
-        "extract": "🔍 Extract Data", 
-        "calculate": "🧮 Calculate Interest",
-        "validate": "✅ Validate Results"
-    }
-    
-    step_order = ["upload", "extract", "calculate", "validate"]
-    current_index = step_order.index(current_step) if current_step in step_order else 0
-    
-    progress_html = "<div style='text-align: center; margin: 1.5rem 0;'>"
-    
-    for i, (step_key, step_label) in enumerate(steps.items()):
-        if i < current_index:
-            css_class = "progress-step-completed"
-        elif i == current_index:
-            css_class = "progress-step-current"
-        else:
-            css_class = "progress-step-pending"
-        
-        progress_html += f'<span class="progress-step {css_class}">{step_label}</span>'
-        
-        # Add arrow between steps (except after last step)
-        if i < len(steps) - 1:
-            progress_html += ' <span style="color: #6c757d; margin: 0 0.5rem;">→</span> '
+    current_index = _STEP_ORDER.index(current_step) if current_step in _STEP_ORDER else 0
     
-    progress_html += "</div>"
+    # Completed steps before the current one, pending steps after it
+    css_classes = (
+        ["progress-step-completed"] * current_index
+        + ["progress-step-current"]
+        + ["progress-step-pending"] * (len(_STEP_ITEMS) - current_index - 1)
+    )
+    spans = [
+        _PROGRESS_STEP.format(css_class=css_class, label=step_label)
+        for css_class, (_, step_label) in zip(css_classes, _STEP_ITEMS)
+    ]
     
-    st.markdown(progress_html, unsafe_allow_html=True)
-
-def create_sample_correct_pdf():
-    """
-    Create a sample PDF with correct interest calculation that will PASS validation.
+    # Arrows go between steps (not after the last one)
+    progress_html = _PROGRESS_WRAPPER.format(body=_PROGRESS_ARROW.join(spans))
     
-    Returns:
-        bytes: PDF content as bytes
-    """
-    try:
-        from reportlab.lib.pagesizes import letter
-        from reportlab.pdfgen import canvas
-        from reportlab.lib.styles import getSampleStyleSheet
-        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-        import io
-        
-        buffer = io.BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=letter)
-        styles = getSampleStyleSheet()
-        story = []
-        
-        # Sample data that will result in PASS
-        story.append(Paragraph("INTEREST PAYMENT NOTICE", styles['Title']))
-        story.append(Spacer(1, 20))
-        
-        story.append(Paragraph("Loan Information:", styles['Heading2']))
-        story.append(Paragraph("Principal Amount: $1,000,000.00", styles['Normal']))
-        story.append(Paragraph("Interest Rate: 5.25%", styles['Normal']))
-        story.append(Paragraph("Start Date: 01/01/2024", styles['Normal']))
-        story.append(Paragraph("End Date: 03/31/2024", styles['Normal']))
-        story.append(Spacer(1, 20))
-        
-        # Calculate correct interest: $1,000,000 × 0.0525 × 90 ÷ 360 = $13,125.00
-        story.append(Paragraph("Interest Calculation:", styles['Heading2']))
-        story.append(Paragraph("Interest Amount: $13,125.00", styles['Normal']))
-        story.append(Spacer(1, 20))
-        
-        story.append(Paragraph("This notice contains correct interest calculation.", styles['Normal']))
-        
-        doc.build(story)
-        buffer.seek(0)
-        return buffer.getvalue()
-        
-    except ImportError:
-        # Fallback: create a simple text-based PDF using basic PDF structure
-        return create_simple_pdf_correct()
-
-def create_sample_incorrect_pdf():
-    """
-    Create a sample PDF with incorrect interest calculation that will FAIL validation.
-    
-    Returns:
-        bytes: PDF content as bytes
-    """
-    try:
-        from reportlab.lib.pagesizes import letter
-        from reportlab.pdfgen import canvas
-        from reportlab.lib.styles import getSampleStyleSheet
-        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-        import io
-        
-        buffer = io.BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=letter)
-        styles = getSampleStyleSheet()
-        story = []
-        
-        # Sample data that will result in FAIL
-        story.append(Paragraph("INTEREST PAYMENT NOTICE", styles['Title']))
-        story.append(Spacer(1, 20))
-        
-        story.append(Paragraph("Loan Information:", styles['Heading2']))
-        story.append(Paragraph("Principal Amount: $1,000,000.00", styles['Normal']))
-        story.append(Paragraph("Interest Rate: 5.25%", styles['Normal']))
-        story.append(Paragraph("Start Date: 01/01/2024", styles['Normal']))
-        story.append(Paragraph("End Date: 03/31/2024", styles['Normal']))
-        story.append(Spacer(1, 20))
-        
-        # Incorrect interest: should be $13,125.00 but showing $15,000.00
-        story.append(Paragraph("Interest Calculation:", styles['Heading2']))
-        story.append(Paragraph("Interest Amount: $15,000.00", styles['Normal']))
-        story.append(Spacer(1, 20))
-        
-        story.append(Paragraph("This notice contains incorrect interest calculation for testing.", styles['Normal']))
-        
-        doc.build(story)
-        buffer.seek(0)
-        return buffer.getvalue()
-        
-    except ImportError:
-        # Fallback: create a simple text-based PDF using basic PDF structure
-        return create_simple_pdf_incorrect()
+    (placeholder or st).markdown(progress_html, unsafe_allow_html=True)
 
-def create_simple_pdf_correct():
-    """
-    Create a simple PDF with correct interest calculation using basic PDF structure.
-    
-    Returns:
-        bytes: PDF content as bytes
-    """
-    pdf_content = """%PDF-1.4
+# Minimal single-page PDF used when ReportLab is unavailable; only the
+# interest amount differs between the PASS and FAIL samples
+_SIMPLE_PDF_TEMPLATE = """%PDF-1.4
 1 0 obj
 <<
 /Type /Catalog
@@ -500,7 +266,7 @@ BT
 0 -20 Td
 (End Date: 03/31/2024) Tj
 0 -40 Td
-(Interest Amount: $13,125.00) Tj
+(Interest Amount: {amount}) Tj
 ET
 endstream
 endobj
@@ -529,115 +295,204 @@ trailer
 startxref
 801
 %%EOF"""
-    return pdf_content.encode('utf-8')
 
-def create_simple_pdf_incorrect():
+
+def _build_simple_pdf(amount: str) -> bytes:
     """
-    Create a simple PDF with incorrect interest calculation using basic PDF structure.
+    Build a simple sample PDF showing the given interest amount.
     
+    Args:
+        amount: Formatted interest amount (e.g., "$13,125.00")
+        
     Returns:
         bytes: PDF content as bytes
     """
-    pdf_content = """%PDF-1.4
-1 0 obj
-<<
-/Type /Catalog
-/Pages 2 0 R
->>
-endobj
+    return _SIMPLE_PDF_TEMPLATE.format(amount=amount).encode('utf-8')
 
-2 0 obj
-<<
-/Type /Pages
-/Kids [3 0 R]
-/Count 1
->>
-endobj
 
-3 0 obj
-<<
-/Type /Page
-/Parent 2 0 R
-/MediaBox [0 0 612 792]
-/Contents 4 0 R
-/Resources <<
-/Font <<
-/F1 5 0 R
->>
->>
->>
-endobj
+_SIMPLE_PDF_PASS = _build_simple_pdf("$13,125.00")
+_SIMPLE_PDF_FAIL = _build_simple_pdf("$15,000.00")
 
-4 0 obj
-<<
-/Length 400
->>
-stream
-BT
-/F1 16 Tf
-50 750 Td
-(INTEREST PAYMENT NOTICE) Tj
-0 -40 Td
-/F1 12 Tf
-(Principal Amount: $1,000,000.00) Tj
-0 -20 Td
-(Interest Rate: 5.25%) Tj
-0 -20 Td
-(Start Date: 01/01/2024) Tj
-0 -20 Td
-(End Date: 03/31/2024) Tj
-0 -40 Td
-(Interest Amount: $15,000.00) Tj
-ET
-endstream
-endobj
+# ReportLab handles, imported on first use (see _reportlab)
+_RL = None
 
-5 0 obj
-<<
-/Type /Font
-/Subtype /Type1
-/BaseFont /Helvetica
->>
-endobj
 
-xref
-0 6
-0000000000 65535 f 
-0000000009 00000 n 
-0000000058 00000 n 
-0000000115 00000 n 
-0000000274 00000 n 
-0000000724 00000 n 
-trailer
-<<
-/Size 6
-/Root 1 0 R
->>
-startxref
-801
-%%EOF"""
-    return pdf_content.encode('utf-8')
+def _reportlab() -> SimpleNamespace:
+    """
+    Import the ReportLab pieces used for sample PDFs once and cache the handles.
+    
+    Returns:
+        SimpleNamespace: ReportLab names used by the sample PDF builders
+        
+    Raises:
+        ImportError: If ReportLab is not installed
+    """
+    global _RL
+    if _RL is None:
+        from reportlab.lib.pagesizes import letter
+        from reportlab.lib.styles import getSampleStyleSheet
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+        
+        _RL = SimpleNamespace(
+            letter=letter,
+            getSampleStyleSheet=getSampleStyleSheet,
+            SimpleDocTemplate=SimpleDocTemplate,
+            Paragraph=Paragraph,
+            Spacer=Spacer
+        )
+    return _RL
+
+@st.cache_data(show_spinner=False)
+def create_sample_correct_pdf():
+    """
+    Create a sample PDF with correct interest calculation that will PASS validation.
+    
+    Returns:
+        bytes: PDF content as bytes
+    """
+    try:
+        rl = _reportlab()
+        
+        buffer = io.BytesIO()
+        doc = rl.SimpleDocTemplate(buffer, pagesize=rl.letter)
+        styles = rl.getSampleStyleSheet()
+        story = []
+        
+        # Sample data that will result in PASS
+        story.append(rl.Paragraph("INTEREST PAYMENT NOTICE", styles['Title']))
+        story.append(rl.Spacer(1, 20))
+        
+        story.append(rl.Paragraph("Loan Information:", styles['Heading2']))
+        story.append(rl.Paragraph("Principal Amount: $1,000,000.00", styles['Normal']))
+        story.append(rl.Paragraph("Interest Rate: 5.25%", styles['Normal']))
+        story.append(rl.Paragraph("Start Date: 01/01/2024", styles['Normal']))
+        story.append(rl.Paragraph("End Date: 03/31/2024", styles['Normal']))
+        story.append(rl.Spacer(1, 20))
+        
+        # Calculate correct interest: $1,000,000 × 0.0525 × 90 ÷ 360 = $13,125.00
+        story.append(rl.Paragraph("Interest Calculation:", styles['Heading2']))
+        story.append(rl.Paragraph("Interest Amount: $13,125.00", styles['Normal']))
+        story.append(rl.Spacer(1, 20))
+        
+        story.append(rl.Paragraph("This notice contains correct interest calculation.", styles['Normal']))
+        
+        doc.build(story)
+        buffer.seek(0)
+        return buffer.getvalue()
+        
+    except ImportError:
+        # Fallback: create a simple text-based PDF using basic PDF structure
+        return create_simple_pdf_correct()
+
+@st.cache_data(show_spinner=False)
+def create_sample_incorrect_pdf():
+    """
+    Create a sample PDF with incorrect interest calculation that will FAIL validation.
+    
+    Returns:
+        bytes: PDF content as bytes
+    """
+    try:
+        rl = _reportlab()
+        
+        buffer = io.BytesIO()
+        doc = rl.SimpleDocTemplate(buffer, pagesize=rl.letter)
+        styles = rl.getSampleStyleSheet()
+        story = []
+        
+        # Sample data that will result in FAIL
+        story.append(rl.Paragraph("INTEREST PAYMENT NOTICE", styles['Title']))
+        story.append(rl.Spacer(1, 20))
+        
+        story.append(rl.Paragraph("Loan Information:", styles['Heading2']))
+        story.append(rl.Paragraph("Principal Amount: $1,000,000.00", styles['Normal']))
+        story.append(rl.Paragraph("Interest Rate: 5.25%", styles['Normal']))
+        story.append(rl.Paragraph("Start Date: 01/01/2024", styles['Normal']))
+        story.append(rl.Paragraph("End Date: 03/31/2024", styles['Normal']))
+        story.append(rl.Spacer(1, 20))
+        
+        # Incorrect interest: should be $13,125.00 but showing $15,000.00
+        story.append(rl.Paragraph("Interest Calculation:", styles['Heading2']))
+        story.append(rl.Paragraph("Interest Amount: $15,000.00", styles['Normal']))
+        story.append(rl.Spacer(1, 20))
+        
+        story.append(rl.Paragraph("This notice contains incorrect interest calculation for testing.", styles['Normal']))
+        
+        doc.build(story)
+        buffer.seek(0)
+        return buffer.getvalue()
+        
+    except ImportError:
+        # Fallback: create a simple text-based PDF using basic PDF structure
+        return create_simple_pdf_incorrect()
+
+@st.cache_data(show_spinner=False)
+def create_simple_pdf_correct():
+    """
+    Create a simple PDF with correct interest calculation using basic PDF structure.
+    
+    Returns:
+        bytes: PDF content as bytes
+    """
+    return _SIMPLE_PDF_PASS
+
+@st.cache_data(show_spinner=False)
+def create_simple_pdf_incorrect():
+    """
+    Create a simple PDF with incorrect interest calculation using basic PDF structure.
+    
+    Returns:
+        bytes: PDF content as bytes
+    """
+    return _SIMPLE_PDF_FAIL
+
+# Sample PDF payloads built once at import so the first render does not block
+# on a ReportLab document build
+try:
+    _SAMPLE_PASS_BYTES = create_sample_correct_pdf()
+    _SAMPLE_FAIL_BYTES = create_sample_incorrect_pdf()
+except Exception:
+    _SAMPLE_PASS_BYTES = _SIMPLE_PDF_PASS
+    _SAMPLE_FAIL_BYTES = _SIMPLE_PDF_FAIL
+
+# Static markup for render_upload_section
+_UPLOAD_PROMPT_HTML = """
+    <div class="upload-section">
+        <h4 style="color: #1f4e79; margin-top: 0;">Select PDF Document</h4>
+        <p style="color: #6c757d; margin-bottom: 1rem;">
+            Upload a PDF file containing the interest payment notice to validate calculations.
+        </p>
+    </div>
+    """
+_REQUIRED_INFO_HTML = """
+    <div style="background: #e3f2fd; padding: 1.5rem; border-radius: 10px; border-left: 4px solid #2196f3;">
+        <h5 style="color: #1565c0; margin-top: 0;">📋 Required Information</h5>
+        <ul style="color: #1976d2; font-size: 0.9rem; margin-bottom: 0;">
+            <li>Principal amount ($)</li>
+            <li>Interest rate (%)</li>
+            <li>Start & end dates</li>
+            <li>Interest amount</li>
+        </ul>
+    </div>
+    """
+_SAMPLE_PDFS_HTML = """
+    <div style="background: #f8f9fa; padding: 1.5rem; border-radius: 10px; border-left: 4px solid #28a745;">
+        <h5 style="color: #155724; margin-top: 0;">📥 Sample PDFs for Testing</h5>
+        <p style="color: #155724; font-size: 0.85rem; margin-bottom: 1rem;">
+            Download sample files to test the validator:
+        </p>
+    </div>
+    """
 
 def render_upload_section():
     """Render the file upload section with enhanced styling and guidance."""
-    st.markdown("""
-    <div class="section-header">
-        <h3>📄 Upload Interest Payment Notice</h3>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_UPLOAD_HEADER_HTML, unsafe_allow_html=True)
     
     # Create three columns for better layout with sample PDFs
     col1, col2, col3 = st.columns([2, 1, 1])
     
     with col1:
-        st.markdown("""
-        <div class="upload-section">
-            <h4 style="color: #1f4e79; margin-top: 0;">Select PDF Document</h4>
-            <p style="color: #6c757d; margin-bottom: 1rem;">
-                Upload a PDF file containing the interest payment notice to validate calculations.
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_UPLOAD_PROMPT_HTML, unsafe_allow_html=True)
         
         uploaded_file = st.file_uploader(
             "Choose a PDF file",
@@ -647,218 +502,169 @@ def render_upload_section():
         )
     
     with col2:
-        st.markdown("""
-        <div style="background: #e3f2fd; padding: 1.5rem; border-radius: 10px; border-left: 4px solid #2196f3;">
-            <h5 style="color: #1565c0; margin-top: 0;">📋 Required Information</h5>
-            <ul style="color: #1976d2; font-size: 0.9rem; margin-bottom: 0;">
-                <li>Principal amount ($)</li>
-                <li>Interest rate (%)</li>
-                <li>Start & end dates</li>
-                <li>Interest amount</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_REQUIRED_INFO_HTML, unsafe_allow_html=True)
     
     with col3:
-        st.markdown("""
-        <div style="background: #f8f9fa; padding: 1.5rem; border-radius: 10px; border-left: 4px solid #28a745;">
-            <h5 style="color: #155724; margin-top: 0;">📥 Sample PDFs for Testing</h5>
-            <p style="color: #155724; font-size: 0.85rem; margin-bottom: 1rem;">
-                Download sample files to test the validator:
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_SAMPLE_PDFS_HTML, unsafe_allow_html=True)
         
         # Sample PDF download buttons
-        sample_correct_pdf = create_sample_correct_pdf()
-        sample_incorrect_pdf = create_sample_incorrect_pdf()
-        
         st.download_button(
             label="📄 Download Sample (PASS)",
-            data=sample_correct_pdf,
-            file_name="sample_correct_interest_notice.pdf",
-            mime="application/pdf",
+            data=_SAMPLE_PASS_BYTES,
+            file_name=_PASS_FILENAME,
+            mime=_PDF_MIME,
             help="Download a sample PDF that will show PASS result",
             use_container_width=True
         )
         
         st.download_button(
             label="📄 Download Sample (FAIL)",
-            data=sample_incorrect_pdf,
-            file_name="sample_incorrect_interest_notice.pdf", 
-            mime="application/pdf",
+            data=_SAMPLE_FAIL_BYTES,
+            file_name=_FAIL_FILENAME,
+            mime=_PDF_MIME,
             help="Download a sample PDF that will show FAIL result",
             use_container_width=True
         )
     
     if uploaded_file is not None:
         if validate_pdf_file(uploaded_file):
-            st.success(f"✅ **File uploaded successfully:** {uploaded_file.name}")
-            
-            # Show file details
-            file_size = len(uploaded_file.getvalue()) / 1024  # KB
-            st.info(f"📊 **File details:** {file_size:.1f} KB • Ready for processing")
+            # Show upload confirmation and file details in a single element
+            file_size = uploaded_file.size / 1024  # KB
+            st.success(
+                f"✅ **File uploaded successfully:** {uploaded_file.name}  \n"
+                f"📊 **File details:** {file_size:.1f} KB • Ready for processing"
+            )
             return uploaded_file
         else:
-            st.error("❌ **Invalid file format.** Please upload a PDF file.")
-            st.markdown("""
-            <div style="background: #fff3cd; padding: 1rem; border-radius: 8px; border-left: 4px solid #ffc107; margin-top: 1rem;">
-                <strong>💡 Tip:</strong> Ensure your file has a .pdf extension and is not corrupted.
-            </div>
-            """, unsafe_allow_html=True)
+            st.error(
+                "❌ **Invalid file format.** Please upload a PDF file.  \n"
+                "💡 **Tip:** Ensure your file has a .pdf extension and is not corrupted."
+            )
             return None
     
     return None
 
-def render_extracted_data(extracted_data: ExtractedData):
+def _html_table(columns: tuple[str, ...], rows) -> str:
     """
-    Render extracted data in a professionally formatted table.
+    Build a static HTML table styled by the ``.data-table`` CSS rules.
     
     Args:
-        extracted_data: ExtractedData object containing extracted information
+        columns: Column header labels
+        rows: Iterable of row tuples, one cell per column
+        
+    Returns:
+        str: HTML ``<table>`` markup
     """
-    st.markdown("""
-    <div class="section-header">
-        <h3>📋 Extracted Financial Data</h3>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Check if any data was extracted
-    has_data = any([
-        extracted_data.principal_amount is not None,
-        extracted_data.interest_rate is not None,
-        extracted_data.start_date is not None,
-        extracted_data.end_date is not None,
-        extracted_data.notice_interest_amount is not None
-    ])
-    
-    if not has_data:
-        st.markdown("""
-        <div style="background: #fff3cd; padding: 2rem; border-radius: 10px; border-left: 4px solid #ffc107; text-align: center;">
-            <h4 style="color: #856404; margin-top: 0;">⚠️ No Financial Data Found</h4>
-            <p style="color: #856404; margin-bottom: 0;">
-                No financial data could be extracted from the PDF. Please ensure the document contains clearly marked financial information.
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-        return
+    header = "".join(f"<th>{column}</th>" for column in columns)
+    body = "".join(
+        "<tr>" + "".join(f"<td>{cell}</td>" for cell in row) + "</tr>"
+        for row in rows
+    )
+    return f'<table class="data-table"><thead><tr>{header}</tr></thead><tbody>{body}</tbody></table>'
+
+# ExtractedData fields shown in the extracted-data table
+_DATA_FIELDS = ("principal_amount", "interest_rate", "start_date", "end_date", "notice_interest_amount")
+
+# Extracted-data table rows: (display label, ExtractedData attribute, value formatter)
+_FIELD_SPECS: tuple[tuple[str, str, Callable[[Any], str]], ...] = (
+    ("💰 Principal Amount", "principal_amount", lambda v: f"${v:,.2f}"),
+    ("📈 Interest Rate", "interest_rate", lambda v: f"{v * 100:.4f}%"),
+    ("📅 Start Date", "start_date", lambda v: v.strftime("%m/%d/%Y")),
+    ("📅 End Date", "end_date", lambda v: v.strftime("%m/%d/%Y")),
+    ("💵 Notice Interest Amount", "notice_interest_amount", lambda v: f"${v:,.2f}"),
+)
+
+# Confidence buckets checked in order: (minimum confidence, display level)
+_CONFIDENCE_LEVELS = ((0.8, "🟢 High"), (0.6, "🟡 Medium"))
+_LOW_CONFIDENCE_LEVEL = "🔴 Low"
+
+
+def _confidence_level(confidence: float) -> str:
+    """Map an extraction confidence score to its display level."""
+    for threshold, level in _CONFIDENCE_LEVELS:
+        if confidence >= threshold:
+            return level
+    return _LOW_CONFIDENCE_LEVEL
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _build_extracted_table(*field_values) -> tuple[str, int]:
+    """
+    Build the extracted-data HTML table, cached on the extracted field values.
     
+    Args:
+        *field_values: ExtractedData values in ``_DATA_FIELDS`` order
+        
+    Returns:
+        tuple[str, int]: (table HTML, number of fields extracted)
+    """
     # Create data for display table with enhanced formatting
-    data_rows = []
+    rows = []
+    extracted_count = 0
     
-    # Helper function to create status indicator
-    def get_status_indicator(value, field_name):
+    for (label, _, formatter), value in zip(_FIELD_SPECS, field_values):
         if value is not None:
-            return "✅ Extracted"
+            rows.append((label, formatter(value), "✅ Extracted"))
+            extracted_count += 1
         else:
-            return "❌ Missing"
-    
-    if extracted_data.principal_amount is not None:
-        data_rows.append({
-            "Field": "💰 Principal Amount",
-            "Value": f"${extracted_data.principal_amount:,.2f}",
-            "Status": get_status_indicator(extracted_data.principal_amount, "principal")
-        })
-    else:
-        data_rows.append({
-            "Field": "💰 Principal Amount",
-            "Value": "Not found",
-            "Status": get_status_indicator(None, "principal")
-        })
+            rows.append((label, "Not found", "❌ Missing"))
     
-    if extracted_data.interest_rate is not None:
-        data_rows.append({
-            "Field": "📈 Interest Rate",
-            "Value": f"{extracted_data.interest_rate * 100:.4f}%",
-            "Status": get_status_indicator(extracted_data.interest_rate, "rate")
-        })
-    else:
-        data_rows.append({
-            "Field": "📈 Interest Rate",
-            "Value": "Not found",
-            "Status": get_status_indicator(None, "rate")
-        })
+    return _html_table(("Field", "Value", "Status"), rows), extracted_count
+
+# Static markup for render_extracted_data
+_NO_DATA_HTML = """
+    <div style="background: #fff3cd; padding: 2rem; border-radius: 10px; border-left: 4px solid #ffc107; text-align: center;">
+        <h4 style="color: #856404; margin-top: 0;">⚠️ No Financial Data Found</h4>
+        <p style="color: #856404; margin-bottom: 0;">
+            No financial data could be extracted from the PDF. Please ensure the document contains clearly marked financial information.
+        </p>
+    </div>
+    """
+
+@st.fragment
+def render_extracted_data(extracted_data: ExtractedData):
+    """
+    Render extracted data in a professionally formatted table.
     
-    if extracted_data.start_date is not None:
-        data_rows.append({
-            "Field": "📅 Start Date",
-            "Value": extracted_data.start_date.strftime("%m/%d/%Y"),
-            "Status": get_status_indicator(extracted_data.start_date, "start_date")
-        })
-    else:
-        data_rows.append({
-            "Field": "📅 Start Date",
-            "Value": "Not found",
-            "Status": get_status_indicator(None, "start_date")
-        })
+    Args:
+        extracted_data: ExtractedData object containing extracted information
+    """
+    st.markdown(_EXTRACTED_HEADER_HTML, unsafe_allow_html=True)
     
-    if extracted_data.end_date is not None:
-        data_rows.append({
-            "Field": "📅 End Date",
-            "Value": extracted_data.end_date.strftime("%m/%d/%Y"),
-            "Status": get_status_indicator(extracted_data.end_date, "end_date")
-        })
-    else:
-        data_rows.append({
-            "Field": "📅 End Date",
-            "Value": "Not found",
-            "Status": get_status_indicator(None, "end_date")
-        })
+    # Check if any data was extracted
+    has_data = any(getattr(extracted_data, field) is not None for field in _DATA_FIELDS)
     
-    if extracted_data.notice_interest_amount is not None:
-        data_rows.append({
-            "Field": "💵 Notice Interest Amount",
-            "Value": f"${extracted_data.notice_interest_amount:,.2f}",
-            "Status": get_status_indicator(extracted_data.notice_interest_amount, "interest")
-        })
-    else:
-        data_rows.append({
-            "Field": "💵 Notice Interest Amount",
-            "Value": "Not found",
-            "Status": get_status_indicator(None, "interest")
-        })
+    if not has_data:
+        st.markdown(_NO_DATA_HTML, unsafe_allow_html=True)
+        return
     
-    # Display as a formatted table
-    df = pd.DataFrame(data_rows)
-    st.dataframe(
-        df,
-        use_container_width=True,
-        hide_index=True,
-        column_config={
-            "Field": st.column_config.TextColumn("Field", width="medium"),
-            "Value": st.column_config.TextColumn("Value", width="medium"),
-            "Status": st.column_config.TextColumn("Status", width="small")
-        }
+    # Display as a static HTML table (no dataframe grid for a fixed 5-row payload)
+    table_html, extracted_count = _build_extracted_table(
+        *(getattr(extracted_data, field) for field in _DATA_FIELDS)
     )
+    st.markdown(table_html, unsafe_allow_html=True)
     
     # Show extraction confidence if available
     if extracted_data.extraction_confidence:
         with st.expander("📊 Extraction Confidence Details", expanded=False):
             st.markdown("**Data extraction confidence levels:**")
             
-            confidence_data = []
-            for field, confidence in extracted_data.extraction_confidence.items():
-                confidence_level = "High" if confidence >= 0.8 else "Medium" if confidence >= 0.6 else "Low"
-                confidence_color = "🟢" if confidence >= 0.8 else "🟡" if confidence >= 0.6 else "🔴"
-                
-                confidence_data.append({
-                    "Field": field.replace('_', ' ').title(),
-                    "Confidence": f"{confidence * 100:.0f}%",
-                    "Level": f"{confidence_color} {confidence_level}"
-                })
+            confidence_rows = [
+                (field.replace('_', ' ').title(), f"{confidence * 100:.0f}%", _confidence_level(confidence))
+                for field, confidence in extracted_data.extraction_confidence.items()
+            ]
             
-            if confidence_data:
-                conf_df = pd.DataFrame(confidence_data)
-                st.dataframe(conf_df, use_container_width=True, hide_index=True)
+            if confidence_rows:
+                st.markdown(
+                    _html_table(("Field", "Confidence", "Level"), confidence_rows),
+                    unsafe_allow_html=True
+                )
                 
                 # Show guidance for low confidence extractions
-                low_confidence = [item for item in confidence_data if "Low" in item["Level"]]
-                if low_confidence:
+                if any(row[2] == _LOW_CONFIDENCE_LEVEL for row in confidence_rows):
                     st.warning("⚠️ **Low confidence extractions detected.** Please review these values carefully.")
     
     # Add summary statistics
-    extracted_count = sum(1 for row in data_rows if "✅" in row["Status"])
-    total_fields = len(data_rows)
+    total_fields = len(_FIELD_SPECS)
     
     if extracted_count == total_fields:
         st.success(f"🎉 **Complete extraction:** All {total_fields} required fields found")
@@ -866,6 +672,63 @@ def render_extracted_data(extracted_data: ExtractedData):
         missing_count = total_fields - extracted_count
         st.warning(f"⚠️ **Partial extraction:** {extracted_count}/{total_fields} fields found ({missing_count} missing)")
 
+@st.cache_data(show_spinner=False, max_entries=32)
+def _cached_validate(principal_amount, interest_rate, start_date, end_date,
+                     notice_interest_amount, extraction_confidence: tuple):
+    """
+    Run comprehensive validation, memoized on the extracted field values across reruns.
+    
+    ExtractedData is mutable, so the cache is keyed on its values (in
+    ``_DATA_FIELDS`` order plus the confidence items) rather than the object.
+    
+    Returns:
+        ValidationResult: Comprehensive validation results
+    """
+    extracted_data = ExtractedData()
+    extracted_data.principal_amount = principal_amount
+    extracted_data.interest_rate = interest_rate
+    extracted_data.start_date = start_date
+    extracted_data.end_date = end_date
+    extracted_data.notice_interest_amount = notice_interest_amount
+    extracted_data.extraction_confidence = dict(extraction_confidence)
+    return perform_comprehensive_validation(extracted_data)
+
+def _hash_uploaded_file(uploaded_file: UploadedFile) -> bytes:
+    """
+    Hash an uploaded file by content so identical PDFs share a cache entry.
+    
+    The digest is remembered in session state against the upload's ``file_id``,
+    so reruns that still hold the same upload skip re-reading and re-hashing
+    the whole PDF.
+    """
+    file_id = getattr(uploaded_file, "file_id", None)
+    cached = st.session_state.get("_pdf_digest")
+    if file_id is not None and cached is not None and cached[0] == file_id:
+        return cached[1]
+    
+    digest = hashlib.blake2b(uploaded_file.getvalue(), digest_size=16).digest()
+    if file_id is not None:
+        st.session_state["_pdf_digest"] = (file_id, digest)
+    return digest
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _cached_extract(pdf_digest: bytes, _uploaded_file: UploadedFile) -> ExtractedData:
+    """
+    Extract loan data from an uploaded PDF, memoized on its content digest across reruns.
+    
+    Only the digest is hashed for the cache key; the upload is passed unhashed
+    and its bytes are copied out only on a cache miss. Failures raise and are
+    therefore never cached.
+    
+    Args:
+        pdf_digest: Content digest of the PDF, from _hash_uploaded_file
+        _uploaded_file: Streamlit UploadedFile the digest was taken from
+        
+    Returns:
+        ExtractedData: Extracted data object
+    """
+    return extract_loan_data(io.BytesIO(_uploaded_file.getvalue()))
+
 @log_operation("pdf_extraction")
 def process_pdf_extraction(uploaded_file):
     """
@@ -881,31 +744,33 @@ def process_pdf_extraction(uploaded_file):
     file_name = uploaded_file.name if uploaded_file else "unknown"
     
     try:
-        with LoggingContext(logger, loan_file_name=file_name):
-            with st.spinner("🔍 Extracting financial data from PDF..."):
-                logger.info(f"Starting PDF extraction for {file_name}")
-                
-                # Extract data from PDF
-                extracted_data = extract_loan_data(uploaded_file)
-                
-                # Log extraction results
-                log_extraction_result(extracted_data, file_name)
-                
-                # Perform comprehensive validation
-                logger.info("Performing comprehensive data validation")
-                validation_result = perform_comprehensive_validation(extracted_data)
-                
-                # Display validation results
-                display_validation_results(validation_result)
+        with st.spinner("🔍 Extracting financial data from PDF..."):
+            logger.info("Starting PDF extraction for %s", file_name)
+            
+            # Extract data from PDF
+            extracted_data = _cached_extract(_hash_uploaded_file(uploaded_file), uploaded_file)
+            
+            # Log extraction results
+            log_extraction_result(extracted_data, file_name)
+            
+            # Perform comprehensive validation
+            logger.info("Performing comprehensive data validation")
+            validation_result = _cached_validate(
+                *(getattr(extracted_data, field) for field in _DATA_FIELDS),
+                tuple(extracted_data.extraction_confidence.items())
+            )
+            
+            # Display validation results
+            display_validation_results(validation_result)
+            
+            # Return data even if there are warnings (but not if there are errors)
+            if validation_result.is_valid:
+                logger.info("PDF extraction completed successfully for %s", file_name)
+                return extracted_data
+            else:
+                logger.warning("PDF extraction failed validation for %s", file_name)
+                return None
                 
-                # Return data even if there are warnings (but not if there are errors)
-                if validation_result.is_valid:
-                    logger.info(f"PDF extraction completed successfully for {file_name}")
-                    return extracted_data
-                else:
-                    logger.warning(f"PDF extraction failed validation for {file_name}")
-                    return None
-                    
     except Exception as e:
         log_error(e, "pdf_extraction", file_name)
         
@@ -922,7 +787,7 @@ def process_pdf_extraction(uploaded_file):
         """)
         
         # Log detailed error information for debugging
-        logger.error(f"Detailed error trace for {file_name}: {traceback.format_exc()}")
+        logger.error("Detailed error trace for %s", file_name, exc_info=True)
         
         return None
 
@@ -972,7 +837,74 @@ def display_validation_results(validation_result):
     else:
         st.success(f"✅ **Data Validation Passed** - {display_info['summary']}")
 
+@st.cache_data(show_spinner=False, max_entries=128)
+def _cached_validate_inputs(principal: Optional[float], rate: Optional[float],
+                            start_date: Optional[datetime], end_date: Optional[datetime]) -> dict:
+    """Validate calculation inputs, memoized on the input values across reruns."""
+    return validate_calculation_inputs(principal, rate, start_date, end_date)
+
+@st.cache_data(show_spinner=False, max_entries=128)
+def _cached_calculate(principal: float, rate: float,
+                      start_date: datetime, end_date: datetime) -> CalculationResult:
+    """Calculate interest with details, memoized on the input values across reruns."""
+    return calculate_interest_with_details(principal, rate, start_date, end_date)
+
+# Static markup for render_calculation_results
+_EXPECTED_INTEREST_CARD_TMPL = Template("""
+    <div style="background: linear-gradient(135deg, #e8f5e8 0%, #d4edda 100%); 
+                padding: 2rem; border-radius: 15px; text-align: center; 
+                border: 2px solid #28a745; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
+        <h4 style="color: #155724; margin-top: 0;">💵 Expected Interest</h4>
+        <h2 style="color: #155724; margin: 0.5rem 0; font-size: 2rem; font-weight: 600;">
+            $amount
+        </h2>
+        <p style="color: #155724; margin-bottom: 0; font-size: 0.9rem;">
+            Based on banking formula
+        </p>
+    </div>
+    """)
+_CALCULATION_NEXT_STEPS_HTML = """
+    <div style="background: #e3f2fd; padding: 1.5rem; border-radius: 8px; margin-top: 1rem;">
+        <strong>💡 Next Steps:</strong>
+        <ul style="margin-bottom: 0;">
+            <li>Ensure all required fields are extracted from the PDF</li>
+            <li>Verify that dates are in the correct format</li>
+            <li>Check that amounts and rates are reasonable values</li>
+        </ul>
+    </div>
+    """
+_CALCULATION_ERROR_HTML = """
+    <div style="background: #f8d7da; padding: 2rem; border-radius: 10px; border-left: 4px solid #dc3545;">
+        <h4 style="color: #721c24; margin-top: 0;">❌ Calculation Error</h4>
+    </div>
+    """
+_CALCULATION_SOLUTIONS_HTML = """
+    <div style="background: #e3f2fd; padding: 1.5rem; border-radius: 8px; margin-top: 1rem;">
+        <strong>💡 Possible Solutions:</strong>
+        <ul style="margin-bottom: 0;">
+            <li>Verify that all extracted data is valid</li>
+            <li>Check that dates are in the correct format</li>
+            <li>Ensure principal amount and interest rate are reasonable values</li>
+        </ul>
+    </div>
+    """
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _build_calculation_table(principal: float, rate: float, start_date: str, end_date: str,
+                             days: int, day_count_convention: str) -> str:
+    """Build the calculation-summary HTML table, cached on the displayed values."""
+    calc_rows = [
+        ("💰 Principal Amount", format_currency(principal)),
+        ("📈 Annual Interest Rate", format_percentage(rate)),
+        ("📅 Start Date", start_date),
+        ("📅 End Date", end_date),
+        ("⏱️ Days in Period", format_days(days)),
+        ("🏦 Day Count Convention", day_count_convention)
+    ]
+    return _html_table(("Component", "Value"), calc_rows)
+
 @log_operation("interest_calculation")
+@st.fragment
 def render_calculation_results(extracted_data: ExtractedData):
     """
     Render interest calculation results with enhanced styling and progress indicators.
@@ -982,15 +914,11 @@ def render_calculation_results(extracted_data: ExtractedData):
     """
     logger = get_logger()
     
-    st.markdown("""
-    <div class="section-header">
-        <h3>🧮 Interest Calculation</h3>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_CALCULATION_HEADER_HTML, unsafe_allow_html=True)
     
     try:
         # Validate that we have all required data for calculation
-        validation_errors = validate_calculation_inputs(
+        validation_errors = _cached_validate_inputs(
             extracted_data.principal_amount,
             extracted_data.interest_rate,
             extracted_data.start_date,
@@ -998,35 +926,29 @@ def render_calculation_results(extracted_data: ExtractedData):
         )
         
         if validation_errors:
-            logger.warning(f"Calculation validation failed: {validation_errors}")
+            logger.warning("Calculation validation failed: %s", validation_errors)
             
-            st.markdown("""
+            # Emit the header and every field error as a single block
+            error_items = "".join(
+                f"<li><strong>{field.replace('_', ' ').title()}</strong>: {error}</li>"
+                for field, error in validation_errors.items()
+            )
+            st.markdown(f"""
             <div style="background: #f8d7da; padding: 2rem; border-radius: 10px; border-left: 4px solid #dc3545;">
                 <h4 style="color: #721c24; margin-top: 0;">❌ Cannot Perform Calculation</h4>
                 <p style="color: #721c24; margin-bottom: 1rem;">Missing or invalid data prevents interest calculation:</p>
+                <ul style="color: #721c24; margin-bottom: 0;">{error_items}</ul>
             </div>
             """, unsafe_allow_html=True)
             
-            for field, error in validation_errors.items():
-                st.error(f"• **{field.replace('_', ' ').title()}**: {error}")
-            
-            st.markdown("""
-            <div style="background: #e3f2fd; padding: 1.5rem; border-radius: 8px; margin-top: 1rem;">
-                <strong>💡 Next Steps:</strong>
-                <ul style="margin-bottom: 0;">
-                    <li>Ensure all required fields are extracted from the PDF</li>
-                    <li>Verify that dates are in the correct format</li>
-                    <li>Check that amounts and rates are reasonable values</li>
-                </ul>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(_CALCULATION_NEXT_STEPS_HTML, unsafe_allow_html=True)
             return None
         
         # Show calculation progress
         with st.spinner("🔢 Calculating expected interest using banking formula..."):
             logger.info("Starting interest calculation")
             
-            calculation_result = calculate_interest_with_details(
+            calculation_result = _cached_calculate(
                 extracted_data.principal_amount,
                 extracted_data.interest_rate,
                 extracted_data.start_date,
@@ -1036,92 +958,49 @@ def render_calculation_results(extracted_data: ExtractedData):
             # Log calculation results
             log_calculation_result(calculation_result)
         
+        # Bind the values used throughout the display once
+        details = calculation_result.calculation_details
+        principal = details['principal']
+        rate = details['annual_rate']
+        days = calculation_result.days_calculated
+        expected_interest = calculation_result.expected_interest
+        
         # Display calculation success
         st.success("✅ **Interest calculation completed successfully**")
-        logger.info(f"Interest calculation successful: ${calculation_result.expected_interest:.2f}")
-        
-        # Create enhanced calculation summary
-        col1, col2 = st.columns([2, 1])
-        
-        with col1:
-            # Main calculation table
-            calc_data = [
-                {
-                    "Component": "💰 Principal Amount",
-                    "Value": format_currency(calculation_result.calculation_details['principal'])
-                },
-                {
-                    "Component": "📈 Annual Interest Rate",
-                    "Value": format_percentage(calculation_result.calculation_details['annual_rate'])
-                },
-                {
-                    "Component": "📅 Start Date",
-                    "Value": calculation_result.calculation_details['start_date']
-                },
-                {
-                    "Component": "📅 End Date",
-                    "Value": calculation_result.calculation_details['end_date']
-                },
-                {
-                    "Component": "⏱️ Days in Period",
-                    "Value": format_days(calculation_result.days_calculated)
-                },
-                {
-                    "Component": "🏦 Day Count Convention",
-                    "Value": calculation_result.calculation_details['day_count_convention']
-                }
-            ]
-            
-            calc_df = pd.DataFrame(calc_data)
-            st.dataframe(
-                calc_df,
-                use_container_width=True,
-                hide_index=True,
-                column_config={
-                    "Component": st.column_config.TextColumn("Component", width="medium"),
-                    "Value": st.column_config.TextColumn("Value", width="medium")
-                }
-            )
+        logger.info("Interest calculation successful: $%.2f", expected_interest)
         
-        with col2:
-            # Expected interest result card
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #e8f5e8 0%, #d4edda 100%); 
-                        padding: 2rem; border-radius: 15px; text-align: center; 
-                        border: 2px solid #28a745; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
-                <h4 style="color: #155724; margin-top: 0;">💵 Expected Interest</h4>
-                <h2 style="color: #155724; margin: 0.5rem 0; font-size: 2rem; font-weight: 600;">
-                    {format_currency(calculation_result.expected_interest)}
-                </h2>
-                <p style="color: #155724; margin-bottom: 0; font-size: 0.9rem;">
-                    Based on banking formula
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
+        # Calculation table and expected interest card side by side in one grid block
+        calc_table_html = _build_calculation_table(
+            principal, rate, details['start_date'], details['end_date'],
+            days, details['day_count_convention']
+        )
+        interest_card_html = _EXPECTED_INTEREST_CARD_TMPL.substitute(
+            amount=format_currency(expected_interest)
+        ).strip()
+        st.markdown(
+            f'<div class="calculation-summary"><div>{calc_table_html}</div>{interest_card_html}</div>',
+            unsafe_allow_html=True
+        )
         
         # Show detailed calculation steps in an enhanced expander
         with st.expander("📊 Detailed Calculation Steps", expanded=False):
             st.markdown(f"**🔢 Formula Used:** `{calculation_result.formula_used}`")
             
             st.markdown("**📋 Step-by-step calculation:**")
-            steps = calculation_result.calculation_details['calculation_steps']
-            
-            for i, (step_key, step_value) in enumerate(steps.items(), 1):
-                st.markdown(f"**Step {i}:** {step_value}")
+            st.markdown("  \n".join(
+                f"**Step {i}:** {step_value}"
+                for i, step_value in enumerate(details['calculation_steps'].values(), 1)
+            ))
             
             # Add visual formula breakdown
             st.markdown("---")
             st.markdown("**🎯 Formula Breakdown:**")
             
-            principal = calculation_result.calculation_details['principal']
-            rate = calculation_result.calculation_details['annual_rate']
-            days = calculation_result.days_calculated
-            
             st.markdown(f"""
             ```
             Interest = Principal × Rate × Days ÷ 360
             Interest = ${principal:,.2f} × {rate:.6f} × {days} ÷ 360
-            Interest = ${calculation_result.expected_interest:,.2f}
+            Interest = ${expected_interest:,.2f}
             ```
             """)
         
@@ -1130,33 +1009,94 @@ def render_calculation_results(extracted_data: ExtractedData):
     except Exception as e:
         log_error(e, "interest_calculation")
         
-        st.markdown("""
-        <div style="background: #f8d7da; padding: 2rem; border-radius: 10px; border-left: 4px solid #dc3545;">
-            <h4 style="color: #721c24; margin-top: 0;">❌ Calculation Error</h4>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_CALCULATION_ERROR_HTML, unsafe_allow_html=True)
         
         st.error(f"Failed to calculate interest: {str(e)}")
         
         # Provide helpful guidance
-        st.markdown("""
-        <div style="background: #e3f2fd; padding: 1.5rem; border-radius: 8px; margin-top: 1rem;">
-            <strong>💡 Possible Solutions:</strong>
-            <ul style="margin-bottom: 0;">
-                <li>Verify that all extracted data is valid</li>
-                <li>Check that dates are in the correct format</li>
-                <li>Ensure principal amount and interest rate are reasonable values</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_CALCULATION_SOLUTIONS_HTML, unsafe_allow_html=True)
         
         # Log detailed error for debugging
-        logger.error(f"Detailed calculation error: {traceback.format_exc()}")
+        logger.error("Detailed calculation error", exc_info=True)
         
         return None
 
 
+# Static markup for render_validation_results
+_VALIDATION_HEADER_HTML = """
+    <div class="section-header">
+        <h3>🔍 Validation Results</h3>
+        <p style="color: #6c757d; margin-top: 0.5rem; font-style: italic;">Final pre-send validation before lender notification</p>
+    </div>
+    """
+_VALIDATION_READY_HTML = """
+    <div style="background: #d1ecf1; padding: 1.5rem; border-radius: 8px; border-left: 4px solid #17a2b8; margin-top: 1rem;">
+        <strong>🎉 Ready to Proceed:</strong>
+        <ul style="margin-bottom: 0;">
+            <li>The notice is ready to be sent to lenders</li>
+            <li>Interest calculation is accurate within banking standards</li>
+            <li>No further action required</li>
+        </ul>
+    </div>
+    """
+_STATUS_CARD_TMPL = Template("""
+            <div class="status-card status-card-$status_class">
+                <h2>$title</h2>
+                <h3>$message</h3>
+                <p>$explanation</p>
+            </div>
+            """)
+_DIRECTION_CARD_TMPL = Template("""
+                <div style="background: #f8d7da; padding: 1.5rem; border-radius: 8px; border-left: 4px solid #dc3545; margin-top: 1rem;">
+                    <strong>$icon Notice Amount is $label:</strong> The notice shows <strong>$amount $direction</strong> than expected
+                </div>
+                """)
+_VALIDATION_ERROR_HTML = """
+    <div style="background: #f8d7da; padding: 2rem; border-radius: 10px; border-left: 4px solid #dc3545;">
+        <h4 style="color: #721c24; margin-top: 0;">❌ Validation Error</h4>
+    </div>
+    """
+_VALIDATION_SOLUTIONS_HTML = """
+    <div style="background: #e3f2fd; padding: 1.5rem; border-radius: 8px; margin-top: 1rem;">
+        <strong>💡 Possible Solutions:</strong>
+        <ul style="margin-bottom: 0;">
+            <li>Ensure all required data was extracted successfully</li>
+            <li>Verify that the interest calculation completed without errors</li>
+            <li>Check that the PDF contains a valid interest amount for comparison</li>
+        </ul>
+    </div>
+    """
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _build_comparison_table(expected: float, notice: float, difference: float,
+                            percentage: float, tolerance: float) -> str:
+    """Build the expected-vs-notice comparison HTML table, cached on the compared amounts."""
+    comparison_rows = [
+        (
+            "🧮 <strong>Expected (Calculated)</strong>",
+            f"<strong>{format_currency(expected)}</strong>",
+            "Based on extracted data and banking formula"
+        ),
+        (
+            "📄 <strong>Notice (PDF)</strong>",
+            f"<strong>{format_currency(notice)}</strong>",
+            "Amount shown in the interest payment notice"
+        ),
+        (
+            "📏 <strong>Difference</strong>",
+            f"<strong>{format_currency(difference)}</strong>",
+            f"Percentage difference: {percentage:.2f}%"
+        ),
+        (
+            "⚖️ <strong>Tolerance</strong>",
+            f"<strong>{format_currency(tolerance)}</strong>",
+            "Acceptable variance ($1 or 0.01%, whichever is larger)"
+        )
+    ]
+    return _html_table(("Source", "Amount", "Details"), comparison_rows)
+
 @log_operation("validation")
+@st.fragment
 def render_validation_results(extracted_data: ExtractedData, calculation_result: CalculationResult):
     """
     Render validation results with enhanced professional styling.
@@ -1167,30 +1107,25 @@ def render_validation_results(extracted_data: ExtractedData, calculation_result:
     """
     logger = get_logger()
     
-    st.markdown("""
-    <div class="section-header">
-        <h3>🔍 Validation Results</h3>
-        <p style="color: #6c757d; margin-top: 0.5rem; font-style: italic;">Final pre-send validation before lender notification</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_VALIDATION_HEADER_HTML, unsafe_allow_html=True)
     
     try:
         # Check if validation can be performed
         can_validate, issues = can_perform_validation(extracted_data, calculation_result)
         
         if not can_validate:
-            logger.warning(f"Validation cannot be performed: {issues}")
+            logger.warning("Validation cannot be performed: %s", issues)
             
-            st.markdown("""
+            # Emit the header and every issue as a single block
+            issue_items = "".join(f"<li>{issue}</li>" for issue in issues)
+            st.markdown(f"""
             <div style="background: #fff3cd; padding: 2rem; border-radius: 10px; border-left: 4px solid #ffc107;">
                 <h4 style="color: #856404; margin-top: 0;">⚠️ Cannot Perform Validation</h4>
                 <p style="color: #856404; margin-bottom: 1rem;">The following issues prevent validation:</p>
+                <ul style="color: #856404; margin-bottom: 0;">{issue_items}</ul>
             </div>
             """, unsafe_allow_html=True)
             
-            for issue in issues:
-                st.warning(f"• {issue}")
-            
             # Show expected interest if available
             if calculation_result and calculation_result.expected_interest is not None:
                 st.info(f"**Expected Interest:** {format_currency(calculation_result.expected_interest)}")
@@ -1211,98 +1146,65 @@ def render_validation_results(extracted_data: ExtractedData, calculation_result:
         # Create enhanced comparison table
         st.markdown("**📊 Calculation Comparison:**")
         
-        comparison_data = [
-            {
-                "Source": "🧮 **Expected (Calculated)**",
-                "Amount": f"**{format_currency(validation_result.expected_amount)}**",
-                "Details": "Based on extracted data and banking formula"
-            },
-            {
-                "Source": "📄 **Notice (PDF)**",
-                "Amount": f"**{format_currency(validation_result.notice_amount)}**",
-                "Details": "Amount shown in the interest payment notice"
-            },
-            {
-                "Source": "📏 **Difference**",
-                "Amount": f"**{format_currency(validation_result.difference_amount)}**",
-                "Details": f"Percentage difference: {validation_result.percentage_difference:.2f}%"
-            },
-            {
-                "Source": "⚖️ **Tolerance**",
-                "Amount": f"**{format_currency(validation_result.tolerance_used)}**",
-                "Details": "Acceptable variance ($1 or 0.01%, whichever is larger)"
+        st.markdown(
+            _build_comparison_table(
+                validation_result.expected_amount,
+                validation_result.notice_amount,
+                validation_result.difference_amount,
+                validation_result.percentage_difference,
+                validation_result.tolerance_used
+            ),
+            unsafe_allow_html=True
+        )
+        
+        # Display enhanced status card based on validation result
+        passed = validation_result.status == "PASS"
+        if passed:
+            logger.info("Validation PASSED - difference: $%.2f", validation_result.difference_amount)
+            card_vars = {
+                'status_class': 'pass',
+                'title': f"{display_info['status_icon']} {display_info['status_text']}",
+                'explanation': display_info['explanation'],
             }
-        ]
-        
-        comp_df = pd.DataFrame(comparison_data)
-        st.dataframe(
-            comp_df,
-            use_container_width=True,
-            hide_index=True,
-            column_config={
-                "Source": st.column_config.TextColumn("Source", width="medium"),
-                "Amount": st.column_config.TextColumn("Amount", width="small"),
-                "Details": st.column_config.TextColumn("Details", width="large")
+        else:
+            logger.warning("Validation FAILED - difference: $%.2f", validation_result.difference_amount)
+            card_vars = {
+                'status_class': 'fail',
+                'title': '🔴 Validation Failed – Interest Mismatch Detected',
+                'explanation': (
+                    f"The notice shows ${validation_result.difference_amount:,.2f} more than expected. "
+                    f"This difference exceeds the acceptable tolerance of ${validation_result.tolerance_used:,.2f}. "
+                    "Please review the interest calculation in the notice."
+                ),
             }
+        
+        st.markdown(
+            _STATUS_CARD_TMPL.substitute(message=display_info['status_message'], **card_vars),
+            unsafe_allow_html=True
         )
         
-        # Display enhanced status card based on validation result
-        if validation_result.status == "PASS":
-            logger.info(f"Validation PASSED - difference: ${validation_result.difference_amount:.2f}")
-            
-            st.markdown(f"""
-            <div class="status-card status-card-pass">
-                <h2>{display_info['status_icon']} {display_info['status_text']}</h2>
-                <h3>{display_info['status_message']}</h3>
-                <p>{display_info['explanation']}</p>
-            </div>
-            """, unsafe_allow_html=True)
-            
+        if passed:
             st.success(f"✅ **Validation successful** - Difference of {format_currency(validation_result.difference_amount)} is  within  acceptable  tolerance of {format_currency(validation_result.tolerance_used)}")
             
             # Show additional success details
-            st.markdown("""
-            <div style="background: #d1ecf1; padding: 1.5rem; border-radius: 8px; border-left: 4px solid #17a2b8; margin-top: 1rem;">
-                <strong>🎉 Ready to Proceed:</strong>
-                <ul style="margin-bottom: 0;">
-                    <li>The notice is ready to be sent to lenders</li>
-                    <li>Interest calculation is accurate within banking standards</li>
-                    <li>No further action required</li>
-                </ul>
-            </div>
-            """, unsafe_allow_html=True)
-            
+            st.markdown(_VALIDATION_READY_HTML, unsafe_allow_html=True)
         else:
-            logger.warning(f"Validation FAILED - difference: ${validation_result.difference_amount:.2f}")
-            
-            st.markdown(f"""
-            <div class="status-card status-card-fail">
-                <h2>🔴 Validation Failed – Interest Mismatch Detected</h2>
-                <h3>{display_info['status_message']}</h3>
-                <p>The notice shows ${validation_result.difference_amount:,.2f} more than expected. This difference exceeds the acceptable tolerance of ${validation_result.tolerance_used:,.2f}. Please review the interest calculation in the notice.</p>
-            </div>
-            """, unsafe_allow_html=True)
-            
             # Show direction of difference with enhanced styling
-            if validation_result.notice_amount > validation_result.expected_amount:
-                st.markdown(f"""
-                <div style="background: #f8d7da; padding: 1.5rem; border-radius: 8px; border-left: 4px solid #dc3545; margin-top: 1rem;">
-                    <strong>📈 Notice Amount is Higher:</strong> The notice shows <strong>${validation_result.difference_amount:,.2f} more</strong> than expected
-                </div>
-                """, unsafe_allow_html=True)
-            else:
-                st.markdown(f"""
-                <div style="background: #f8d7da; padding: 1.5rem; border-radius: 8px; border-left: 4px solid #dc3545; margin-top: 1rem;">
-                    <strong>📉 Notice Amount is Lower:</strong> The notice shows <strong>${validation_result.difference_amount:,.2f} less</strong> than expected
-                </div>
-                """, unsafe_allow_html=True)
+            higher = validation_result.notice_amount > validation_result.expected_amount
+            st.markdown(_DIRECTION_CARD_TMPL.substitute(
+                icon='📈' if higher else '📉',
+                label='Higher' if higher else 'Lower',
+                amount=f"${validation_result.difference_amount:,.2f}",
+                direction='more' if higher else 'less'
+            ), unsafe_allow_html=True)
         
         # Show recommendations in an enhanced format
         if display_info['recommendations']:
             with st.expander("💡 Recommendations & Next Steps", expanded=validation_result.status == "FAIL"):
-                st.markdown("**Recommended actions:**")
-                for i, recommendation in enumerate(display_info['recommendations'], 1):
-                    st.markdown(f"{i}. {recommendation}")
+                st.markdown("**Recommended actions:**\n\n" + "\n".join(
+                    f"{i}. {recommendation}"
+                    for i, recommendation in enumerate(display_info['recommendations'], 1)
+                ))
                 
                 if validation_result.status == "FAIL":
                     st.markdown("---")
@@ -1317,37 +1219,37 @@ def render_validation_results(extracted_data: ExtractedData, calculation_result:
     except Exception as e:
         log_error(e, "validation")
         
-        st.markdown("""
-        <div style="background: #f8d7da; padding: 2rem; border-radius: 10px; border-left: 4px solid #dc3545;">
-            <h4 style="color: #721c24; margin-top: 0;">❌ Validation Error</h4>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_VALIDATION_ERROR_HTML, unsafe_allow_html=True)
         
         st.error(f"Failed to perform validation: {str(e)}")
         
         # Provide helpful guidance
-        st.markdown("""
-        <div style="background: #e3f2fd; padding: 1.5rem; border-radius: 8px; margin-top: 1rem;">
-            <strong>💡 Possible Solutions:</strong>
-            <ul style="margin-bottom: 0;">
-                <li>Ensure all required data was extracted successfully</li>
-                <li>Verify that the interest calculation completed without errors</li>
-                <li>Check that the PDF contains a valid interest amount for comparison</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_VALIDATION_SOLUTIONS_HTML, unsafe_allow_html=True)
         
         # Log detailed error for debugging
-        logger.error(f"Detailed validation error: {traceback.format_exc()}")
+        logger.error("Detailed validation error", exc_info=True)
 
 
-def main():
-    """Main application entry point with enhanced user experience and comprehensive logging."""
-    # Initialize logging
-    logger = setup_logging(
+# Static markup for main
+_FOOTER_HTML = """
+    <div class="app-footer">
+        <strong>🏦 LoanGuard v1.0</strong> • Internal Banking Tool for Interest Validation<br>
+        <small>Syndicated Loan Operations • Professional Grade Validation • Secure Processing</small>
+    </div>
+    """
+
+@st.cache_resource
+def _init_logging():
+    """Configure application logging once per process rather than on every rerun."""
+    return setup_logging(
         log_level="INFO",
         log_file="logs/loanguard.log"
     )
+
+def main():
+    """Main application entry point with enhanced user experience and comprehensive logging."""
+    # Initialize logging
+    logger = _init_logging()
     
     logger.info("LoanGuard application starting")
     
@@ -1363,118 +1265,75 @@ def main():
         # Generate unique session ID for logging context
         if 'session_id' not in st.session_state:
             st.session_state.session_id = f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            logger.info(f"New session started: {st.session_state.session_id}")
+            logger.info("New session started: %s", st.session_state.session_id)
         
         # Create main container for better layout
         with st.container():
-            with LoggingContext(logger, user_session=st.session_state.session_id):
-                # Show progress indicator
-                render_progress_indicator(st.session_state.current_step)
+            # Show progress indicator; later steps overwrite this single slot
+            progress_slot = st.empty()
+            render_progress_indicator(st.session_state.current_step, progress_slot)
+            
+            # File upload section
+            uploaded_file = render_upload_section()
+            
+            if uploaded_file is not None:
+                logger.info("File uploaded: %s", uploaded_file.name)
+                st.session_state.current_step = 'extract'
+                render_progress_indicator(st.session_state.current_step, progress_slot)
                 
-                # File upload section
-                uploaded_file = render_upload_section()
+                # Add spacing
+                st.markdown("<br>", unsafe_allow_html=True)
                 
-                if uploaded_file is not None:
-                    logger.info(f"File uploaded: {uploaded_file.name}")
-                    st.session_state.current_step = 'extract'
-                    render_progress_indicator(st.session_state.current_step)
+                # Process PDF extraction
+                extracted_data = process_pdf_extraction(uploaded_file)
+                
+                if extracted_data is not None:
+                    # Display extracted data
+                    render_extracted_data(extracted_data)
+                    
+                    st.session_state.current_step = 'calculate'
+                    render_progress_indicator(st.session_state.current_step, progress_slot)
                     
                     # Add spacing
                     st.markdown("<br>", unsafe_allow_html=True)
                     
-                    # Process PDF extraction
-                    extracted_data = process_pdf_extraction(uploaded_file)
+                    # Perform interest calculation
+                    calculation_result = render_calculation_results(extracted_data)
                     
-                    if extracted_data is not None:
-                        # Display extracted data
-                        render_extracted_data(extracted_data)
-                        
-                        st.session_state.current_step = 'calculate'
-                        render_progress_indicator(st.session_state.current_step)
+                    if calculation_result is not None:
+                        st.session_state.current_step = 'validate'
+                        render_progress_indicator(st.session_state.current_step, progress_slot)
                         
                         # Add spacing
                         st.markdown("<br>", unsafe_allow_html=True)
                         
-                        # Perform interest calculation
-                        calculation_result = render_calculation_results(extracted_data)
+                        # Display validation results
+                        render_validation_results(extracted_data, calculation_result)
                         
-                        if calculation_result is not None:
-                            st.session_state.current_step = 'validate'
-                            render_progress_indicator(st.session_state.current_step)
-                            
-                            # Add spacing
-                            st.markdown("<br>", unsafe_allow_html=True)
-                            
-                            # Display validation results
-                            render_validation_results(extracted_data, calculation_result)
-                            
-                            logger.info(f"Complete workflow finished for {uploaded_file.name}")
-                        else:
-                            # Reset progress if calculation failed
-                            st.session_state.current_step = 'extract'
-                            logger.warning("Calculation failed, resetting to extract step")
+                        logger.info("Complete workflow finished for %s", uploaded_file.name)
                     else:
-                        # Reset progress if extraction failed
-                        st.session_state.current_step = 'upload'
-                        logger.warning("Extraction failed, resetting to upload step")
+                        # Reset progress if calculation failed
+                        st.session_state.current_step = 'extract'
+                        logger.warning("Calculation failed, resetting to extract step")
                 else:
-                    # Reset progress when no file
+                    # Reset progress if extraction failed
                     st.session_state.current_step = 'upload'
-                    
-                    # Show placeholders when no file is uploaded
-                    st.markdown("""
-                    <div class="section-header">
-                        <h3>📋 Extracted Financial Data</h3>
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
-                    st.markdown("""
-                    <div style="background: #f8f9fa; padding: 2rem; border-radius: 10px; text-align: center; border: 2px dashed #dee2e6;">
-                        <h4 style="color: #6c757d; margin-top: 0;">📄 Upload Required</h4>
-                        <p style="color: #6c757d; margin-bottom: 0;">
-                            Upload a PDF file to see extracted financial data here.
-                        </p>
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
-                    st.markdown("""
-                    <div class="section-header">
-                        <h3>🧮 Interest Calculation</h3>
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
-                    st.markdown("""
-                    <div style="background: #f8f9fa; padding: 2rem; border-radius: 10px; text-align: center; border: 2px dashed #dee2e6;">
-                        <h4 style="color: #6c757d; margin-top: 0;">🔢 Calculation Pending</h4>
-                        <p style="color: #6c757d; margin-bottom: 0;">
-                            Interest calculation details will appear here after data extraction.
-                        </p>
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
-                    st.markdown("""
-                    <div class="section-header">
-                        <h3>🔍 Validation Results</h3>
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
-                    st.markdown("""
-                    <div style="background: #f8f9fa; padding: 2rem; border-radius: 10px; text-align: center; border: 2px dashed #dee2e6;">
-                        <h4 style="color: #6c757d; margin-top: 0;">⏳ Validation Awaiting</h4>
-                        <p style="color: #6c757d; margin-bottom: 0;">
-                            Validation results will appear here after processing.
-                        </p>
-                    </div>
-                    """, unsafe_allow_html=True)
+                    logger.warning("Extraction failed, resetting to upload step")
+            else:
+                # Reset progress when no file
+                st.session_state.current_step = 'upload'
                 
-                # Enhanced footer
-                st.markdown("---")
-                st.markdown("""
-                <div class="app-footer">
-                    <strong>🏦 LoanGuard v1.0</strong> • Internal Banking Tool for Interest Validation<br>
-                    <small>Syndicated Loan Operations • Professional Grade Validation • Secure Processing</small>
-                </div>
-                """, unsafe_allow_html=True)
+                # Show placeholders when no file is uploaded
+                for section_title, card_title, card_message in _PLACEHOLDERS:
+                    st.markdown(_SECTION_HEADER_TMPL.substitute(title=section_title), unsafe_allow_html=True)
+                    st.markdown(
+                        _PLACEHOLDER_TMPL.substitute(title=card_title, message=card_message),
+                        unsafe_allow_html=True
+                    )
+            
+            # Enhanced footer
+            st.markdown("---")
+            st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
     
     except Exception as e:
         log_error(e, "main_application")
@@ -1487,7 +1346,7 @@ def main():
             st.code(str(e))
             st.markdown("**Error Type:** " + type(e).__name__)
         
-        logger.critical(f"Critical application error: {traceback.format_exc()}")
+        logger.critical("Critical application error", exc_info=True)
     
     finally:
         logger.info("LoanGuard application session ended")
@@ -7,13 +7,20 @@ calculating interest amounts, date differences, and currency formatting.
 """
 
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Sequence
 from dataclasses import dataclass
 
 
+# Integer-cents interest arithmetic: day-count basis and rate precision
+_DAY_COUNT_BASIS = 360
+_RATE_SCALE = 10 ** 9
+
+
 @dataclass
 class CalculationResult:
     """Data class to hold interest calculation results and details."""
+    __slots__ = ('expected_interest', 'days_calculated', 'formula_used', 'calculation_details')
+    
     expected_interest: float
     days_calculated: int
     formula_used: str
@@ -38,7 +45,16 @@ def calculate_interest(principal: float, rate: float, start_date: datetime, end_
     Raises:
         ValueError: If inputs are invalid (negative amounts, invalid dates, etc.)
     """
-    # Validate inputs
+    _check_interest_inputs(principal, rate, start_date, end_date)
+    
+    # Calculate days between dates
+    days = (end_date - start_date).days
+    
+    return _core_interest(principal, rate, days)
+
+
+def _check_interest_inputs(principal: float, rate: float, start_date: datetime, end_date: datetime) -> None:
+    """Raise ValueError if the inputs cannot produce a valid interest amount."""
     if principal <= 0:
         raise ValueError("Principal amount must be positive")
     
@@ -47,14 +63,20 @@ def calculate_interest(principal: float, rate: float, start_date: datetime, end_
     
     if start_date >= end_date:
         raise ValueError("Start date must be before end date")
+
+
+def _core_interest(principal: float, rate: float, days: int) -> float:
+    """
+    Apply the banking formula Interest = Principal × Rate × Days / 360, rounded to cents.
     
-    # Calculate days between dates
-    days = calculate_days(start_date, end_date)
-    
-    # Apply banking formula: Interest = Principal × Rate × Days / 360
-    interest = principal * rate * days / 360.0
-    
-    return round(interest, 2)
+    Computed exactly in integer cents (rates carried to nine decimal places) and
+    rounded half-up, so results do not depend on binary floating-point artifacts.
+    """
+    principal_cents = int(round(principal * 100))
+    scaled_rate = int(round(rate * _RATE_SCALE))
+    divisor = _DAY_COUNT_BASIS * _RATE_SCALE
+    cents = (principal_cents * scaled_rate * days + divisor // 2) // divisor
+    return cents / 100
 
 
 def calculate_days(start_date: datetime, end_date: datetime) -> int:
@@ -95,9 +117,11 @@ def calculate_interest_with_details(principal: float, rate: float, start_date: d
     Returns:
         CalculationResult: Object containing calculation results and details
     """
-    # Calculate interest
-    interest = calculate_interest(principal, rate, start_date, end_date)
-    days = calculate_days(start_date, end_date)
+    # Validate once and compute the day count once, then reuse it for the interest
+    _check_interest_inputs(principal, rate, start_date, end_date)
+    days = (end_date - start_date).days
+    interest = _core_interest(principal, rate, days)
+    principal_display = format_currency(principal)
     
     # Create detailed calculation breakdown
     calculation_details = {
@@ -110,10 +134,10 @@ def calculate_interest_with_details(principal: float, rate: float, start_date: d
         'day_count_convention': '360-day',
         'formula': 'Interest = Principal × Rate × Days / 360',
         'calculation_steps': {
-            'step_1': f'Principal = {format_currency(principal)}',
+            'step_1': f'Principal = {principal_display}',
             'step_2': f'Annual Rate = {rate * 100:.4f}%',
             'step_3': f'Days = {days}',
-            'step_4': f'Interest = {format_currency(principal)} × {rate:.6f} × {days} / 360',
+            'step_4': f'Interest = {principal_display} × {rate:.6f} × {days} / 360',
             'step_5': f'Interest = {format_currency(interest)}'
         }
     }
@@ -126,6 +150,41 @@ def calculate_interest_with_details(principal: float, rate: float, start_date: d
     )
 
 
+def calculate_interest_batch(principals: Sequence[float], rates: Sequence[float],
+                             start_dates: Sequence[datetime], end_dates: Sequence[datetime]) -> List[float]:
+    """
+    Calculate interest for many loans at once using the 360-day convention.
+    
+    Equivalent to calling calculate_interest for each loan, but validates and
+    computes in a single loop without the per-call overhead.
+    
+    Args:
+        principals: Loan amounts in dollars
+        rates: Annual interest rates as decimals
+        start_dates: Interest calculation start dates
+        end_dates: Interest calculation end dates
+        
+    Returns:
+        List[float]: Calculated interest amounts, in input order
+        
+    Raises:
+        ValueError: If the sequences differ in length or any loan's inputs are invalid
+    """
+    if not len(principals) == len(rates) == len(start_dates) == len(end_dates):
+        raise ValueError("All input sequences must have the same length")
+    
+    check_inputs = _check_interest_inputs
+    core_interest = _core_interest
+    
+    interests = []
+    append = interests.append
+    for principal, rate, start_date, end_date in zip(principals, rates, start_dates, end_dates):
+        check_inputs(principal, rate, start_date, end_date)
+        append(core_interest(principal, rate, (end_date - start_date).days))
+    
+    return interests
+
+
 def format_currency(amount: float) -> str:
     """
     Format amounts for display with proper currency formatting.
@@ -139,6 +198,10 @@ def format_currency(amount: float) -> str:
     if amount is None:
         return "N/A"
     
+    # Float formatting is deliberate: ",.2f" rounds the exact binary value in C,
+    # whereas pre-scaling to integer cents rounds amount * 100 and disagrees on
+    # half-cent inputs (e.g. 967799.995) while also measuring slower
+    
     # Handle negative amounts
     if amount < 0:
         return f"-${abs(amount):,.2f}"
@@ -195,26 +258,56 @@ def validate_calculation_inputs(principal: Optional[float], rate: Optional[float
     return errors
 
 
+def validate_calculation_inputs_batch(principals: Sequence[float], rates: Sequence[float],
+                                     deltas_days: Sequence[int]) -> Dict[str, List[bool]]:
+    """
+    Flag invalid inputs across many loans at once.
+    
+    Applies the same limits as validate_calculation_inputs, returning one
+    boolean flag per loan for each error class instead of message dictionaries.
+    
+    Args:
+        principals: Principal amounts to validate
+        rates: Interest rates to validate
+        deltas_days: Days between each loan's start and end date
+        
+    Returns:
+        Dict[str, List[bool]]: Error class to per-loan flags (True where the loan fails)
+    """
+    return {
+        'principal_nonpos': [principal <= 0 for principal in principals],
+        'principal_huge': [principal > 1_000_000_000 for principal in principals],
+        'rate_neg': [rate < 0 for rate in rates],
+        'rate_high': [rate > 1.0 for rate in rates],
+        'range_bad': [days <= 0 for days in deltas_days],
+        'range_long': [days > 3650 for days in deltas_days],
+    }
+
+
+# Amount at which 0.01% equals the $1.00 minimum tolerance
+_TOLERANCE_BREAKEVEN = 10_000
+
+
 def calculate_tolerance(amount: float) -> float:
     """
     Calculate acceptable tolerance for interest amount comparison.
     
-    Uses the larger of $1.00 or 0.01% of the amount as tolerance.
+    Uses the larger of $1.00 or 0.01% of the amount as tolerance,
+    following standard banking practices for interest validation.
+    The validator module re-exports this function.
     
     Args:
         amount: Interest amount to calculate tolerance for
         
     Returns:
-        float: Tolerance amount
+        float: Tolerance amount in dollars
     """
-    if amount <= 0:
-        return 1.0  # Minimum $1 tolerance
-    
-    # Calculate 0.01% of amount
-    percentage_tolerance = amount * 0.0001
-    
-    # Return the larger of $1 or 0.01%
-    return max(1.0, percentage_tolerance)
+    # 0.01% of the amount (1 basis point) only exceeds the $1 minimum above
+    # $10,000; a single comparison replaces the max() call, and zero, negative
+    # and NaN amounts fall through to the $1 minimum as before
+    if amount > _TOLERANCE_BREAKEVEN:
+        return amount * 0.0001
+    return 1.0
 
 
 def format_percentage(rate: float) -> str:
@@ -6,14 +6,107 @@ It uses pdfplumber to parse PDF content and extract structured data including
 principal amounts, interest rates, dates, and interest amounts.
 """
 
-import pdfplumber
+import functools
 import re
 from datetime import datetime
 from typing import Dict, Any, Optional
 import io
 
+# Patterns are compiled once at import and reused for every extraction
+
+# More specific patterns that look for principal amounts near relevant keywords,
+# fused into one alternation; each keyword captures into its own named group,
+# listed here in order of preference
+_PRINCIPAL_KEYWORDS = ('principal', 'loan_amount', 'outstanding_balance')
+_PRINCIPAL_PATTERN = re.compile('|'.join((
+    r'(?:principal\s*(?:amount)?)\s*:?\s*\$\s*(?P<principal>[0-9,]+(?:\.[0-9]{2})?)',  # Principal: $1,234,567.89
+    r'(?:loan\s+amount)\s*:?\s*\$\s*(?P<loan_amount>[0-9,]+(?:\.[0-9]{2})?)',  # Loan Amount: $1,234,567.89
+    r'(?:outstanding\s+balance)\s*:?\s*\$\s*(?P<outstanding_balance>[0-9,]+(?:\.[0-9]{2})?)',  # Outstanding Balance: $1,234,567.89
+)), re.IGNORECASE)
+
+# General currency patterns - handle both with and without commas
+_GENERAL_CURRENCY_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\$\s*([0-9,]+(?:\.[0-9]{2})?)',  # $1,234,567.89 or $1234567.89
+))
+
+# Common date formats used in banking documents, grouped by shape so parse_date
+# only tries the formats that can match; order within a group is preference order
+_SLASH_DATE_FORMATS = {
+    4: ('%m/%d/%Y',),    # 12/31/2023
+    2: ('%m/%d/%y',),    # 12/31/23
+}
+_DASH_DATE_FORMATS = {
+    4: ('%m-%d-%Y',),    # 12-31-2023
+    2: ('%m-%d-%y',),    # 12-31-23
+}
+_ISO_DATE_FORMATS = ('%Y-%m-%d',)      # 2023-12-31
+_MONTH_FIRST_DATE_FORMATS = (
+    '%B %d, %Y',     # December 31, 2023
+    '%b %d, %Y',     # Dec 31, 2023
+)
+_DAY_FIRST_DATE_FORMATS = (
+    '%d %B %Y',      # 31 December 2023
+    '%d %b %Y',      # 31 Dec 2023
+)
+
+# Specific interest period date patterns, tried before the general ones; every
+# match is collected, so the alternatives are fused into a single pass
+_INTEREST_DATE_PATTERN = re.compile('|'.join((
+    r'(?:interest\s+period\s+start\s+date|start\s+date)\s*:?\s*(\d{1,2}/\d{1,2}/\d{4})',
+    r'(?:interest\s+period\s+end\s+date|end\s+date)\s*:?\s*(\d{1,2}/\d{1,2}/\d{4})',
+    r'(?:from|start)\s*:?\s*(\d{1,2}/\d{1,2}/\d{4})',
+    r'(?:to|through|end)\s*:?\s*(\d{1,2}/\d{1,2}/\d{4})',
+)), re.IGNORECASE)
+
+# General date patterns (case-sensitive)
+_GENERAL_DATE_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'\b(\d{1,2}/\d{1,2}/\d{4})\b',          # MM/DD/YYYY
+    r'\b(\d{1,2}-\d{1,2}-\d{4})\b',          # MM-DD-YYYY
+    r'\b(\d{4}-\d{1,2}-\d{1,2})\b',          # YYYY-MM-DD
+    r'\b([A-Za-z]+ \d{1,2}, \d{4})\b',       # Month DD, YYYY
+    r'\b(\d{1,2} [A-Za-z]+ \d{4})\b',        # DD Month YYYY
+))
+
+# Context words marking a date as the notice/reference date rather than the interest period
+_NOTICE_CONTEXT_PATTERN = re.compile(r'notice|reference', re.IGNORECASE)
+
+# Regex patterns for percentage values
+# The number is written as \d+(?:\.\d*)? rather than \d+\.?\d*, which matches the
+# same text but has one way to split a digit run instead of many, and unanchored
+# patterns refuse to start mid-run; a long run of digits with no % after it is
+# rejected in linear time instead of backtracking through every split
+_PERCENTAGE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(?<!\d)(\d+(?:\.\d*)?)\s*%',                          # 5.25%
+    r'(?<!\d)(\d+(?:\.\d*)?)\s*percent',                    # 5.25 percent
+    r'(?:rate|interest)\s*:?\s*(\d+(?:\.\d*)?)\s*%',          # Rate: 5.25%
+    r'(?<!\d)(\d+(?:\.\d*)?)\s*(?:per\s*cent|pct)',        # 5.25 per cent
+))
+
+# Patterns specifically for interest amounts, fused like the principal patterns
+# and listed in order of preference
+_INTEREST_AMOUNT_KEYWORDS = ('interest_due', 'total_interest', 'interest_calculated', 'accrued_interest')
+_INTEREST_AMOUNT_PATTERN = re.compile('|'.join((
+    r'(?:interest\s+(?:amount|payment|due))\s*:?\s*\$?\s*(?P<interest_due>[0-9]{1,3}(?:,?[0-9]{3})*(?:\.[0-9]{2})?)',
+    r'(?:total\s+interest)\s*:?\s*\$?\s*(?P<total_interest>[0-9]{1,3}(?:,?[0-9]{3})*(?:\.[0-9]{2})?)',
+    r'(?:interest\s+calculated)\s*:?\s*\$?\s*(?P<interest_calculated>[0-9]{1,3}(?:,?[0-9]{3})*(?:\.[0-9]{2})?)',
+    r'(?:accrued\s+interest)\s*:?\s*\$?\s*(?P<accrued_interest>[0-9]{1,3}(?:,?[0-9]{3})*(?:\.[0-9]{2})?)',
+)), re.IGNORECASE)
+
+# Words that every alternative of a fused keyword pattern contains; a substring
+# check on the lowered text is far cheaper than a regex pass that cannot match
+_PRINCIPAL_PREFILTER_WORDS = ('principal', 'loan', 'outstanding')
+_INTEREST_AMOUNT_PREFILTER_WORDS = ('interest',)
+
+# Fields extract_loan_data can stop reading pages for once each has a match
+# from its most specific pattern
+_ANCHORED_FIELDS = ('principal', 'rate', 'dates', 'interest_amount')
+
 class ExtractedData:
     """Data class to hold extracted financial information from PDF."""
+    __slots__ = (
+        'principal_amount', 'interest_rate', 'start_date', 'end_date',
+        'notice_interest_amount', 'extraction_confidence'
+    )
     
     def __init__(self):
         self.principal_amount: Optional[float] = None
@@ -36,54 +129,142 @@ def extract_loan_data(pdf_file) -> ExtractedData:
     Raises:
         Exception: If PDF cannot be processed or required data cannot be extracted
     """
+    # Imported here so the PDF stack is only loaded once a PDF is processed
+    import pdfplumber
+    
     extracted_data = ExtractedData()
     
     try:
         # Reset file pointer to beginning
         pdf_file.seek(0)
         
-        # Extract text from all pages of the PDF
+        # Buffer other streams (disk files, sockets) in memory once so pdfminer's
+        # many small seeks and reads hit a BytesIO; uploads already are one
+        if isinstance(pdf_file, io.IOBase) and not isinstance(pdf_file, io.BytesIO):
+            pdf_file = io.BytesIO(pdf_file.read())
+        
+        # Read pages in order, noting on each new page which fields have a match
+        # that later pages cannot override, and stop once all of them do; the
+        # remaining pages are never parsed. Fields are then extracted in one pass
+        # over the text read, so fallback values are only chosen with every
+        # earlier keyword-anchored match in view
         with pdfplumber.open(pdf_file) as pdf:
-            full_text = ""
+            page_texts = []
+            anchored_fields = set()
+            interest_dates = set()
             for page in pdf.pages:
                 page_text = page.extract_text()
-                if page_text:
-                    full_text += page_text + "\n"
+                if not page_text:
+                    continue
+                page_texts.append(page_text + "\n")
+                _note_anchored_fields(page_text, anchored_fields, interest_dates)
+                if len(anchored_fields) == len(_ANCHORED_FIELDS):
+                    break
         
+        full_text = "".join(page_texts)
         if not full_text.strip():
             raise Exception("No text could be extracted from the PDF")
         
-        # Extract principal amount
-        principal = parse_currency_amount(full_text)
-        if principal is not None:
-            extracted_data.principal_amount = principal
-            extracted_data.extraction_confidence['principal'] = 0.8
-        
-        # Extract interest rate
-        rate = parse_percentage(full_text)
-        if rate is not None:
-            extracted_data.interest_rate = rate
-            extracted_data.extraction_confidence['rate'] = 0.8
-        
-        # Extract dates
-        dates = extract_dates(full_text)
-        if len(dates) >= 2:
-            # Assume first date is start date, second is end date
-            extracted_data.start_date = dates[0]
-            extracted_data.end_date = dates[1]
-            extracted_data.extraction_confidence['dates'] = 0.7
-        
-        # Extract notice interest amount (look for interest amount patterns)
-        interest_amount = extract_interest_amount(full_text)
-        if interest_amount is not None:
-            extracted_data.notice_interest_amount = interest_amount
-            extracted_data.extraction_confidence['interest_amount'] = 0.8
+        _extract_fields(extracted_data, full_text)
         
         return extracted_data
         
     except Exception as e:
         raise Exception(f"Failed to extract data from PDF: {str(e)}")
 
+def _extract_fields(extracted_data: ExtractedData, text: str) -> None:
+    """
+    Populate extracted_data with every field that can be parsed from text.
+    
+    Args:
+        extracted_data: ExtractedData object being populated
+        text: Text read from the PDF
+    """
+    # Extract principal amount
+    principal = parse_currency_amount(text)
+    if principal is not None:
+        extracted_data.principal_amount = principal
+        extracted_data.extraction_confidence['principal'] = 0.8
+    
+    # Extract interest rate
+    rate = parse_percentage(text)
+    if rate is not None:
+        extracted_data.interest_rate = rate
+        extracted_data.extraction_confidence['rate'] = 0.8
+    
+    # Extract dates
+    dates = extract_dates(text)
+    if len(dates) >= 2:
+        # Assume first date is start date, second is end date
+        extracted_data.start_date = dates[0]
+        extracted_data.end_date = dates[1]
+        extracted_data.extraction_confidence['dates'] = 0.7
+    
+    # Extract notice interest amount (look for interest amount patterns)
+    interest_amount = extract_interest_amount(text)
+    if interest_amount is not None:
+        extracted_data.notice_interest_amount = interest_amount
+        extracted_data.extraction_confidence['interest_amount'] = 0.8
+
+def _note_anchored_fields(page_text: str, anchored_fields: set, interest_dates: set) -> None:
+    """
+    Record which fields page_text gives a match that later pages cannot override.
+    
+    That is a "Principal" amount, a "5.25%" style rate and an "Interest Amount"
+    figure, each within its sanity range, and two distinct interest period
+    dates. Only the new page is scanned; interest period dates are carried
+    across pages in interest_dates, since start and end may be printed apart.
+    
+    Args:
+        page_text: Text of the page just read
+        anchored_fields: Names from _ANCHORED_FIELDS found so far, updated in place
+        interest_dates: Interest period dates found so far, updated in place
+    """
+    if 'principal' not in anchored_fields and _mentions_any(page_text, _PRINCIPAL_PREFILTER_WORDS):
+        for match in _PRINCIPAL_PATTERN.finditer(page_text):
+            if match.lastgroup == _PRINCIPAL_KEYWORDS[0]:
+                amount = _parse_amount(match.group(match.lastgroup))
+                if amount is not None and 1000 <= amount <= 1_000_000_000:
+                    anchored_fields.add('principal')
+                    break
+    
+    if 'rate' not in anchored_fields:
+        for match in _PERCENTAGE_PATTERNS[0].finditer(page_text):
+            if 0.001 <= float(match.group(1)) / 100.0 <= 0.5:
+                anchored_fields.add('rate')
+                break
+    
+    if 'dates' not in anchored_fields:
+        for match in _INTEREST_DATE_PATTERN.finditer(page_text):
+            parsed_date = parse_date(match.group(match.lastindex))
+            if parsed_date:
+                interest_dates.add(parsed_date)
+        if len(interest_dates) >= 2:
+            anchored_fields.add('dates')
+    
+    if 'interest_amount' not in anchored_fields and _mentions_any(page_text, _INTEREST_AMOUNT_PREFILTER_WORDS):
+        for match in _INTEREST_AMOUNT_PATTERN.finditer(page_text):
+            if match.lastgroup == _INTEREST_AMOUNT_KEYWORDS[0]:
+                amount = _parse_amount(match.group(match.lastgroup))
+                if amount is not None and 1 <= amount <= 10000000:
+                    anchored_fields.add('interest_amount')
+                    break
+
+def _mentions_any(text: str, words: tuple) -> bool:
+    """Return True if text contains any of the lowercase words, ignoring case."""
+    lowered = text.lower()
+    return any(word in lowered for word in words)
+
+def _parse_amount(amount_str: str) -> Optional[float]:
+    """Convert a matched amount such as "1,234.56" to float, or None if it has no digits."""
+    # Most matched figures have no thousands separators; skip the copy for those
+    if ',' in amount_str:
+        amount_str = amount_str.replace(',', '')
+    try:
+        return float(amount_str)
+    except ValueError:
+        return None
+
 def parse_currency_amount(text: str) -> Optional[float]:
     """
     Parse currency strings to numeric values, specifically looking for principal amounts.
@@ -97,50 +278,49 @@ def parse_currency_amount(text: str) -> Optional[float]:
     if not text:
         return None
     
-    # More specific patterns that look for principal amounts near relevant keywords
-    principal_patterns = [
-        r'(?:principal\s*(?:amount)?)\s*:?\s*\$\s*([0-9,]+(?:\.[0-9]{2})?)',  # Principal: $1,234,567.89
-        r'(?:loan\s+amount)\s*:?\s*\$\s*([0-9,]+(?:\.[0-9]{2})?)',  # Loan Amount: $1,234,567.89
-        r'(?:outstanding\s+balance)\s*:?\s*\$\s*([0-9,]+(?:\.[0-9]{2})?)',  # Outstanding Balance: $1,234,567.89
-    ]
-    
-    # Try principal-specific patterns first
-    for pattern in principal_patterns:
-        matches = re.finditer(pattern, text, re.IGNORECASE)
-        for match in matches:
-            try:
-                amount_str = match.group(1).replace(',', '')
-                amount = float(amount_str)
-                if 1000 <= amount <= 1_000_000_000:  # Reasonable principal range
-                    return amount
-            except (ValueError, IndexError):
-                continue
+    # Try principal-specific patterns first, keeping the first reasonable amount per keyword
+    keyword_amounts = {}
+    if _mentions_any(text, _PRINCIPAL_PREFILTER_WORDS):
+        principal_matches = _PRINCIPAL_PATTERN.finditer(text)
+    else:
+        principal_matches = ()
+    for match in principal_matches:
+        keyword = match.lastgroup
+        if keyword in keyword_amounts:
+            continue
+        amount = _parse_amount(match.group(keyword))
+        if amount is None:
+            continue
+        if 1000 <= amount <= 1_000_000_000:  # Reasonable principal range
+            keyword_amounts[keyword] = amount
+            if keyword == _PRINCIPAL_KEYWORDS[0]:
+                break
+    
+    for keyword in _PRINCIPAL_KEYWORDS:
+        if keyword in keyword_amounts:
+            return keyword_amounts[keyword]
     
     # Fallback to general currency patterns - handle both with and without commas
-    general_patterns = [
-        r'\$\s*([0-9,]+(?:\.[0-9]{2})?)',  # $1,234,567.89 or $1234567.89
-    ]
-    
-    amounts = []
-    for pattern in general_patterns:
-        matches = re.finditer(pattern, text, re.IGNORECASE)
-        for match in matches:
-            try:
-                amount_str = match.group(1).replace(',', '')
-                amount = float(amount_str)
-                # Filter for reasonable principal amounts and exclude account numbers
-                if 1000 <= amount <= 100_000_000:
-                    amounts.append(amount)
-            except (ValueError, IndexError):
-                continue
+    # Track the largest reasonable amount found
+    largest = None
+    for pattern in _GENERAL_CURRENCY_PATTERNS:
+        for match in pattern.finditer(text):
+            amount = _parse_amount(match.group(1))
+            # Filter for reasonable principal amounts and exclude account numbers
+            if amount is not None and 1000 <= amount <= 100_000_000:
+                if largest is None or amount > largest:
+                    largest = amount
     
-    # Return the largest reasonable amount found
-    return max(amounts) if amounts else None
+    return largest
 
+@functools.lru_cache(maxsize=1024)
 def parse_date(text: str) -> Optional[datetime]:
     """
     Parse various date formats to datetime objects.
     
+    Results are memoized; notices repeat the same few date strings, and the
+    returned datetimes are immutable so sharing them is safe.
+    
     Args:
         text: String containing date in various formats
         
@@ -150,27 +330,50 @@ def parse_date(text: str) -> Optional[datetime]:
     if not text:
         return None
     
-    # Common date formats used in banking documents
-    date_formats = [
-        '%m/%d/%Y',      # 12/31/2023
-        '%m-%d-%Y',      # 12-31-2023
-        '%Y-%m-%d',      # 2023-12-31
-        '%B %d, %Y',     # December 31, 2023
-        '%b %d, %Y',     # Dec 31, 2023
-        '%d %B %Y',      # 31 December 2023
-        '%d %b %Y',      # 31 Dec 2023
-        '%m/%d/%y',      # 12/31/23
-        '%m-%d-%y',      # 12-31-23
-    ]
-    
-    for date_format in date_formats:
+    date_str = text.strip()
+    
+    # Zero-padded ISO dates (2023-12-31) go through the C-level fromisoformat;
+    # anything it rejects falls through to strptime below
+    if len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-':
         try:
-            return datetime.strptime(text.strip(), date_format)
+            return datetime.fromisoformat(date_str)
+        except ValueError:
+            pass
+    
+    for date_format in _date_formats_for(date_str):
+        try:
+            return datetime.strptime(date_str, date_format)
         except ValueError:
             continue
     
     return None
 
+def _date_formats_for(date_str: str) -> tuple:
+    """
+    Return the date formats that can match date_str, judged by its shape.
+    
+    %Y only matches four digits and %y two, so the year width picks a single
+    numeric format; formats that cannot match are never attempted.
+    
+    Args:
+        date_str: Stripped date string
+        
+    Returns:
+        tuple: Candidate strptime formats in order of preference
+    """
+    if date_str[:1].isalpha():
+        return _MONTH_FIRST_DATE_FORMATS
+    
+    if '/' in date_str:
+        return _SLASH_DATE_FORMATS.get(len(date_str.rsplit('/', 1)[-1]), ())
+    
+    if '-' in date_str:
+        if len(date_str.split('-', 1)[0]) == 4:
+            return _ISO_DATE_FORMATS
+        return _DASH_DATE_FORMATS.get(len(date_str.rsplit('-', 1)[-1]), ())
+    
+    return _DAY_FIRST_DATE_FORMATS
+
 def extract_dates(text: str) -> list[datetime]:
     """
     Extract interest period dates from text using specific patterns.
@@ -183,23 +386,15 @@ def extract_dates(text: str) -> list[datetime]:
     """
     dates = []
     
-    # Look for specific interest period date patterns first
-    interest_date_patterns = [
-        r'(?:interest\s+period\s+start\s+date|start\s+date)\s*:?\s*(\d{1,2}/\d{1,2}/\d{4})',
-        r'(?:interest\s+period\s+end\s+date|end\s+date)\s*:?\s*(\d{1,2}/\d{1,2}/\d{4})',
-        r'(?:from|start)\s*:?\s*(\d{1,2}/\d{1,2}/\d{4})',
-        r'(?:to|through|end)\s*:?\s*(\d{1,2}/\d{1,2}/\d{4})',
-    ]
-    
     # Extract interest period specific dates
     interest_dates = []
-    for pattern in interest_date_patterns:
-        matches = re.finditer(pattern, text, re.IGNORECASE)
-        for match in matches:
-            date_str = match.group(1)
-            parsed_date = parse_date(date_str)
-            if parsed_date and parsed_date not in interest_dates:
-                interest_dates.append(parsed_date)
+    seen_dates = set()
+    for match in _INTEREST_DATE_PATTERN.finditer(text):
+        date_str = match.group(match.lastindex)
+        parsed_date = parse_date(date_str)
+        if parsed_date and parsed_date not in seen_dates:
+            seen_dates.add(parsed_date)
+            interest_dates.append(parsed_date)
     
     # If we found interest period dates, use those
     if len(interest_dates) >= 2:
@@ -207,27 +402,20 @@ def extract_dates(text: str) -> list[datetime]:
         return interest_dates[:2]  # Return first two (start and end)
     
     # Fallback to general date patterns, but exclude notice dates
-    general_date_patterns = [
-        r'\b(\d{1,2}/\d{1,2}/\d{4})\b',          # MM/DD/YYYY
-        r'\b(\d{1,2}-\d{1,2}-\d{4})\b',          # MM-DD-YYYY
-        r'\b(\d{4}-\d{1,2}-\d{1,2})\b',          # YYYY-MM-DD
-        r'\b([A-Za-z]+ \d{1,2}, \d{4})\b',       # Month DD, YYYY
-        r'\b(\d{1,2} [A-Za-z]+ \d{4})\b',        # DD Month YYYY
-    ]
-    
     all_dates = []
-    for pattern in general_date_patterns:
-        matches = re.finditer(pattern, text)
-        for match in matches:
+    seen_dates = set()
+    for pattern in _GENERAL_DATE_PATTERNS:
+        for match in pattern.finditer(text):
             date_str = match.group(1)
             parsed_date = parse_date(date_str)
-            if parsed_date and parsed_date not in all_dates:
-                # Skip dates that are likely notice dates (look for "notice date" context)
+            if parsed_date and parsed_date not in seen_dates:
+                # Skip dates that are likely notice dates (look for "notice date" context),
+                # searching the surrounding window in place instead of slicing and lowering it
                 context_start = max(0, match.start() - 50)
                 context_end = min(len(text), match.end() + 50)
-                context = text[context_start:context_end].lower()
                 
-                if "notice" not in context and "reference" not in context:
+                if not _NOTICE_CONTEXT_PATTERN.search(text, context_start, context_end):
+                    seen_dates.add(parsed_date)
                     all_dates.append(parsed_date)
     
     # Sort dates chronologically and return first two
@@ -247,18 +435,9 @@ def parse_percentage(text: str) -> Optional[float]:
     if not text:
         return None
     
-    # Regex patterns for percentage values
-    percentage_patterns = [
-        r'(\d+\.?\d*)\s*%',                                    # 5.25%
-        r'(\d+\.?\d*)\s*percent',                              # 5.25 percent
-        r'(?:rate|interest)\s*:?\s*(\d+\.?\d*)\s*%',          # Rate: 5.25%
-        r'(\d+\.?\d*)\s*(?:per\s*cent|pct)',                  # 5.25 per cent
-    ]
-    
     percentages = []
-    for pattern in percentage_patterns:
-        matches = re.finditer(pattern, text, re.IGNORECASE)
-        for match in matches:
+    for pattern in _PERCENTAGE_PATTERNS:
+        for match in pattern.finditer(text):
             try:
                 percentage_str = match.group(1)
                 percentage = float(percentage_str)
@@ -286,26 +465,26 @@ def extract_interest_amount(text: str) -> Optional[float]:
     if not text:
         return None
     
-    # Patterns specifically for interest amounts
-    interest_patterns = [
-        r'(?:interest\s+(?:amount|payment|due))\s*:?\s*\$?\s*([0-9]{1,3}(?:,?[0-9]{3})*(?:\.[0-9]{2})?)',
-        r'(?:total\s+interest)\s*:?\s*\$?\s*([0-9]{1,3}(?:,?[0-9]{3})*(?:\.[0-9]{2})?)',
-        r'(?:interest\s+calculated)\s*:?\s*\$?\s*([0-9]{1,3}(?:,?[0-9]{3})*(?:\.[0-9]{2})?)',
-        r'(?:accrued\s+interest)\s*:?\s*\$?\s*([0-9]{1,3}(?:,?[0-9]{3})*(?:\.[0-9]{2})?)',
-    ]
-    
-    amounts = []
-    for pattern in interest_patterns:
-        matches = re.finditer(pattern, text, re.IGNORECASE)
-        for match in matches:
-            try:
-                amount_str = match.group(1).replace(',', '')
-                amount = float(amount_str)
-                # Interest amounts should be reasonable (not too small, not larger than principal)
-                if 1 <= amount <= 10000000:  # $1 to $10M
-                    amounts.append(amount)
-            except (ValueError, IndexError):
-                continue
+    if not _mentions_any(text, _INTEREST_AMOUNT_PREFILTER_WORDS):
+        return None
+    
+    # Keep the first reasonable amount per keyword
+    keyword_amounts = {}
+    for match in _INTEREST_AMOUNT_PATTERN.finditer(text):
+        keyword = match.lastgroup
+        if keyword in keyword_amounts:
+            continue
+        amount = _parse_amount(match.group(keyword))
+        if amount is None:
+            continue
+        # Interest amounts should be reasonable (not too small, not larger than principal)
+        if 1 <= amount <= 10000000:  # $1 to $10M
+            keyword_amounts[keyword] = amount
+            if keyword == _INTEREST_AMOUNT_KEYWORDS[0]:
+                break
     
-    # Return the first reasonable interest amount found
-    return amounts[0] if amounts else None
\ No newline at end of file
+    # Return the reasonable amount from the most specific pattern found
+    for keyword in _INTEREST_AMOUNT_KEYWORDS:
+        if keyword in keyword_amounts:
+            return keyword_amounts[keyword]
+    return None
\ No newline at end of file
@@ -15,21 +15,97 @@ from dataclasses import dataclass
 @dataclass
 class ValidationError:
     """Data class to hold validation error information."""
+    __slots__ = ('field', 'message', 'severity', 'suggestion')
+    
     field: str
     message: str
     severity: str  # "error", "warning", "info"
-    suggestion: Optional[str] = None
+    suggestion: Optional[str]
+    
+    def __init__(self, field: str, message: str, severity: str, suggestion: Optional[str] = None):
+        # Written by hand because a class-level default for suggestion would
+        # clash with its slot; dataclass keeps an __init__ the class defines
+        self.field = field
+        self.message = message
+        self.severity = severity
+        self.suggestion = suggestion
 
 
 @dataclass
 class ValidationResult:
     """Data class to hold comprehensive validation results."""
+    __slots__ = ('is_valid', 'errors', 'warnings', 'validated_data')
+    
     is_valid: bool
     errors: List[ValidationError]
     warnings: List[ValidationError]
     validated_data: Dict[str, Any]
 
 
+# Errors for missing values never vary, so they are built once and shared.
+# Validators return them in a fresh list; nothing mutates ValidationError instances.
+_DATE_REQUIRED_SUGGESTION = "Ensure the PDF contains a clearly marked date in MM/DD/YYYY format"
+
+_ERR_DATE_REQUIRED = {
+    field_name: ValidationError(
+        field=field_name,
+        message=f"{field_name} is required",
+        severity="error",
+        suggestion=_DATE_REQUIRED_SUGGESTION
+    )
+    for field_name in ("Start date", "End date")
+}
+
+_ERR_PRINCIPAL_REQUIRED = ValidationError(
+    field="principal_amount",
+    message="Principal amount is required",
+    severity="error",
+    suggestion="Ensure the PDF contains a clearly marked dollar amount (e.g., $1,234,567.89)"
+)
+
+_ERR_RATE_REQUIRED = ValidationError(
+    field="interest_rate",
+    message="Interest rate is required",
+    severity="error",
+    suggestion="Ensure the PDF contains a clearly marked percentage (e.g., 5.25%)"
+)
+
+_ERR_INTEREST_AMOUNT_REQUIRED = ValidationError(
+    field="interest_amount",
+    message="Interest amount is required",
+    severity="error",
+    suggestion="Ensure the PDF contains a clearly marked interest amount"
+)
+
+_ERR_NO_DATA_EXTRACTED = ValidationError(
+    field="general",
+    message="No data was extracted from the PDF",
+    severity="error",
+    suggestion="Ensure the PDF contains readable financial information"
+)
+
+
+def refresh_year_bounds() -> None:
+    """
+    Recompute the accepted date year range from the current year.
+    
+    Called at import; long-running services can call it again to pick up a new year.
+    """
+    global _MIN_YEAR, _MAX_YEAR
+    current_year = datetime.now().year
+    _MIN_YEAR = current_year - 50  # 50 years ago
+    _MAX_YEAR = current_year + 10  # 10 years in future
+
+
+# Accepted date year range, computed once rather than per validated date
+_MIN_YEAR: int
+_MAX_YEAR: int
+refresh_year_bounds()
+
+# Indexed by date.weekday(); English names, matching strftime("%A") in the C locale
+_WEEKDAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+
 def validate_date_format_and_range(date_value: Optional[datetime], field_name: str) -> List[ValidationError]:
     """
     Validate date format and check if date is within reasonable range.
@@ -41,41 +117,44 @@ def validate_date_format_and_range(date_value: Optional[datetime], field_name: s
     Returns:
         List[ValidationError]: List of validation errors (empty if valid)
     """
-    errors = []
-    
     if date_value is None:
-        errors.append(ValidationError(
-            field=field_name,
-            message=f"{field_name} is required",
-            severity="error",
-            suggestion="Ensure the PDF contains a clearly marked date in MM/DD/YYYY format"
-        ))
-        return errors
+        required_error = _ERR_DATE_REQUIRED.get(field_name)
+        if required_error is None:
+            required_error = ValidationError(
+                field=field_name,
+                message=f"{field_name} is required",
+                severity="error",
+                suggestion=_DATE_REQUIRED_SUGGESTION
+            )
+        return [required_error]
+    
+    errors = []
     
     # Check if date is within reasonable range (not too far in past or future)
-    current_year = datetime.now().year
-    min_year = current_year - 50  # 50 years ago
-    max_year = current_year + 10  # 10 years in future
+    min_year = _MIN_YEAR
+    max_year = _MAX_YEAR
+    year = date_value.year
     
-    if date_value.year < min_year:
+    if year < min_year:
         errors.append(ValidationError(
             field=field_name,
-            message=f"{field_name} is too far in the past ({date_value.year})",
+            message=f"{field_name} is too far in the past ({year})",
             severity="error",
             suggestion=f"Date should be between {min_year} and {max_year}"
         ))
     
-    if date_value.year > max_year:
+    if year > max_year:
         errors.append(ValidationError(
             field=field_name,
-            message=f"{field_name} is too far in the future ({date_value.year})",
+            message=f"{field_name} is too far in the future ({year})",
             severity="error",
             suggestion=f"Date should be between {min_year} and {max_year}"
         ))
     
     # Check for weekend dates (warning only, as some banks do use weekend dates)
-    if date_value.weekday() >= 5:  # Saturday = 5, Sunday = 6
-        day_name = date_value.strftime("%A")
+    weekday = date_value.weekday()
+    if weekday >= 5:  # Saturday = 5, Sunday = 6
+        day_name = _WEEKDAY_NAMES[weekday]
         errors.append(ValidationError(
             field=field_name,
             message=f"{field_name} falls on a {day_name}",
@@ -155,16 +234,10 @@ def validate_principal_amount(amount: Optional[float]) -> List[ValidationError]:
     Returns:
         List[ValidationError]: List of validation errors (empty if valid)
     """
-    errors = []
-    
     if amount is None:
-        errors.append(ValidationError(
-            field="principal_amount",
-            message="Principal amount is required",
-            severity="error",
-            suggestion="Ensure the PDF contains a clearly marked dollar amount (e.g., $1,234,567.89)"
-        ))
-        return errors
+        return [_ERR_PRINCIPAL_REQUIRED]
+    
+    errors = []
     
     # Check for positive amount
     if amount <= 0:
@@ -216,16 +289,10 @@ def validate_interest_rate(rate: Optional[float]) -> List[ValidationError]:
     Returns:
         List[ValidationError]: List of validation errors (empty if valid)
     """
-    errors = []
-    
     if rate is None:
-        errors.append(ValidationError(
-            field="interest_rate",
-            message="Interest rate is required",
-            severity="error",
-            suggestion="Ensure the PDF contains a clearly marked percentage (e.g., 5.25%)"
-        ))
-        return errors
+        return [_ERR_RATE_REQUIRED]
+    
+    errors = []
     
     # Check for non-negative rate
     if rate < 0:
@@ -278,16 +345,10 @@ def validate_interest_amount(amount: Optional[float], principal: Optional[float]
     Returns:
         List[ValidationError]: List of validation errors (empty if valid)
     """
-    errors = []
-    
     if amount is None:
-        errors.append(ValidationError(
-            field="interest_amount",
-            message="Interest amount is required",
-            severity="error",
-            suggestion="Ensure the PDF contains a clearly marked interest amount"
-        ))
-        return errors
+        return [_ERR_INTEREST_AMOUNT_REQUIRED]
+    
+    errors = []
     
     # Check for non-negative amount
     if amount < 0:
@@ -343,30 +404,21 @@ def validate_required_fields_completeness(extracted_data) -> List[ValidationErro
     Returns:
         List[ValidationError]: List of validation errors (empty if all complete)
     """
-    errors = []
-    
     if extracted_data is None:
-        errors.append(ValidationError(
-            field="general",
-            message="No data was extracted from the PDF",
-            severity="error",
-            suggestion="Ensure the PDF contains readable financial information"
-        ))
-        return errors
+        return [_ERR_NO_DATA_EXTRACTED]
     
-    # Check each required field
-    required_fields = {
-        'principal_amount': 'Principal amount',
-        'interest_rate': 'Interest rate',
-        'start_date': 'Start date',
-        'end_date': 'End date',
-        'notice_interest_amount': 'Interest amount'
-    }
+    errors = []
+    
+    # Check each required field (ExtractedData always defines all five attributes)
+    required_fields = (
+        (extracted_data.principal_amount, 'Principal amount'),
+        (extracted_data.interest_rate, 'Interest rate'),
+        (extracted_data.start_date, 'Start date'),
+        (extracted_data.end_date, 'End date'),
+        (extracted_data.notice_interest_amount, 'Interest amount')
+    )
     
-    missing_fields = []
-    for field_name, display_name in required_fields.items():
-        if getattr(extracted_data, field_name, None) is None:
-            missing_fields.append(display_name)
+    missing_fields = [display_name for value, display_name in required_fields if value is None]
     
     if missing_fields:
         errors.append(ValidationError(
@@ -395,6 +447,24 @@ def validate_required_fields_completeness(extracted_data) -> List[ValidationErro
     return errors
 
 
+def _partition(errs: List[ValidationError], err_out: List[ValidationError],
+               warn_out: List[ValidationError]) -> None:
+    """
+    Split validator output into errors and warnings in a single pass.
+    
+    Args:
+        errs: Validation errors returned by a validator
+        err_out: List receiving entries with "error" severity
+        warn_out: List receiving entries with "warning" severity
+    """
+    for e in errs:
+        severity = e.severity
+        if severity == "error":
+            err_out.append(e)
+        elif severity == "warning":
+            warn_out.append(e)
+
+
 def perform_comprehensive_validation(extracted_data) -> ValidationResult:
     """
     Perform comprehensive validation of all extracted data.
@@ -411,8 +481,7 @@ def perform_comprehensive_validation(extracted_data) -> ValidationResult:
     
     # Validate required fields completeness
     completeness_errors = validate_required_fields_completeness(extracted_data)
-    all_errors.extend([e for e in completeness_errors if e.severity == "error"])
-    all_warnings.extend([e for e in completeness_errors if e.severity == "warning"])
+    _partition(completeness_errors, all_errors, all_warnings)
     
     if extracted_data is None:
         return ValidationResult(
@@ -422,41 +491,34 @@ def perform_comprehensive_validation(extracted_data) -> ValidationResult:
             validated_data=validated_data
         )
     
-    # Validate individual fields
-    principal_errors = validate_principal_amount(extracted_data.principal_amount)
-    all_errors.extend([e for e in principal_errors if e.severity == "error"])
-    all_warnings.extend([e for e in principal_errors if e.severity == "warning"])
-    
-    rate_errors = validate_interest_rate(extracted_data.interest_rate)
-    all_errors.extend([e for e in rate_errors if e.severity == "error"])
-    all_warnings.extend([e for e in rate_errors if e.severity == "warning"])
-    
-    start_date_errors = validate_date_format_and_range(extracted_data.start_date, "Start date")
-    all_errors.extend([e for e in start_date_errors if e.severity == "error"])
-    all_warnings.extend([e for e in start_date_errors if e.severity == "warning"])
-    
-    end_date_errors = validate_date_format_and_range(extracted_data.end_date, "End date")
-    all_errors.extend([e for e in end_date_errors if e.severity == "error"])
-    all_warnings.extend([e for e in end_date_errors if e.severity == "warning"])
-    
-    date_range_errors = validate_date_range(extracted_data.start_date, extracted_data.end_date)
-    all_errors.extend([e for e in date_range_errors if e.severity == "error"])
-    all_warnings.extend([e for e in date_range_errors if e.severity == "warning"])
-    
-    interest_errors = validate_interest_amount(
-        extracted_data.notice_interest_amount, 
-        extracted_data.principal_amount
-    )
-    all_errors.extend([e for e in interest_errors if e.severity == "error"])
-    all_warnings.extend([e for e in interest_errors if e.severity == "warning"])
+    principal = extracted_data.principal_amount
+    rate = extracted_data.interest_rate
+    start_date = extracted_data.start_date
+    end_date = extracted_data.end_date
+    interest_amount = extracted_data.notice_interest_amount
+    
+    # Validate individual fields; a validator is skipped when its value is missing,
+    # since the completeness check above already reports missing fields
+    if principal is not None:
+        _partition(validate_principal_amount(principal), all_errors, all_warnings)
+    if rate is not None:
+        _partition(validate_interest_rate(rate), all_errors, all_warnings)
+    if start_date is not None:
+        _partition(validate_date_format_and_range(start_date, "Start date"), all_errors, all_warnings)
+    if end_date is not None:
+        _partition(validate_date_format_and_range(end_date, "End date"), all_errors, all_warnings)
+        if start_date is not None:
+            _partition(validate_date_range(start_date, end_date), all_errors, all_warnings)
+    if interest_amount is not None:
+        _partition(validate_interest_amount(interest_amount, principal), all_errors, all_warnings)
     
     # Store validated data (even if there are warnings)
     validated_data = {
-        'principal_amount': extracted_data.principal_amount,
-        'interest_rate': extracted_data.interest_rate,
-        'start_date': extracted_data.start_date,
-        'end_date': extracted_data.end_date,
-        'notice_interest_amount': extracted_data.notice_interest_amount
+        'principal_amount': principal,
+        'interest_rate': rate,
+        'start_date': start_date,
+        'end_date': end_date,
+        'notice_interest_amount': interest_amount
     }
     
     # Determine overall validity (no errors, warnings are acceptable)
@@ -516,4 +578,69 @@ def format_validation_errors_for_display(validation_result: ValidationResult) ->
     else:
         display_info['summary'] = "All validations passed"
     
-    return display_info
\ No newline at end of file
+    return display_info
+
+
+def validate_batch(records: List[Any]) -> List[ValidationResult]:
+    """
+    Validate many extracted records, fully validating only those that trip a check.
+    
+    Each record is screened in one pass against the thresholds the individual
+    validators use. A record inside every threshold cannot produce an error or
+    warning, so its result is built directly; any other record (including one with
+    missing fields) goes through perform_comprehensive_validation.
+    
+    Args:
+        records: ExtractedData objects to validate
+        
+    Returns:
+        List[ValidationResult]: One result per record, in input order
+    """
+    min_year = _MIN_YEAR
+    max_year = _MAX_YEAR
+    results = []
+    
+    for record in records:
+        if record is None:
+            results.append(perform_comprehensive_validation(record))
+            continue
+        
+        principal = record.principal_amount
+        rate = record.interest_rate
+        start_date = record.start_date
+        end_date = record.end_date
+        interest_amount = record.notice_interest_amount
+        confidence = record.extraction_confidence
+        
+        # Mirrors the warning/error thresholds of the validators above; comparisons
+        # are written so that NaN or any doubtful value falls through to the full path
+        clean = (
+            principal is not None and rate is not None and interest_amount is not None
+            and start_date is not None and end_date is not None
+            and 1000 <= principal <= 1_000_000_000
+            and 0.0001 <= rate <= 0.25
+            and min_year <= start_date.year <= max_year and start_date.weekday() < 5
+            and min_year <= end_date.year <= max_year and end_date.weekday() < 5
+            and start_date < end_date and 1 <= (end_date - start_date).days <= 730
+            and interest_amount >= 1 and interest_amount / principal <= 0.5
+            and (not confidence or all(c >= 0.5 for c in confidence.values()))
+        )
+        
+        if not clean:
+            results.append(perform_comprehensive_validation(record))
+            continue
+        
+        results.append(ValidationResult(
+            is_valid=True,
+            errors=[],
+            warnings=[],
+            validated_data={
+                'principal_amount': principal,
+                'interest_rate': rate,
+                'start_date': start_date,
+                'end_date': end_date,
+                'notice_interest_amount': interest_amount
+            }
+        ))
+    
+    return results
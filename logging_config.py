@@ -6,46 +6,127 @@ the LoanGuard application. It includes structured logging with different levels
 for various components and operations.
 """
 
+import atexit
+import copy
 import logging
 import logging.handlers
 import os
+import queue
 import sys
 from datetime import datetime
+from time import perf_counter
 from typing import Optional
 import json
 
 
+# json's C-accelerated string escaper (what json.dumps uses by default); it
+# returns the value already quoted
+_encode_json_str = json.encoder.encode_basestring_ascii
+
+# Built once; json.dumps(..., default=str) constructs a new encoder on every call
+_JSON_ENCODER = json.JSONEncoder(default=str)
+
+
+def _json_value(value) -> str:
+    """Serialize a single log field value exactly as json.dumps(..., default=str) would."""
+    if isinstance(value, str):
+        return _encode_json_str(value)
+    return _JSON_ENCODER.encode(value)
+
+
+# Optional record attributes copied into the JSON output, in output order, with
+# the already-encoded '"key": ' prefix each one is written under
+_EXTRA_KEYS = (
+    ('user_session', 'user_session'),
+    ('loan_file_name', 'file_name'),
+    ('loan_operation', 'operation'),
+    ('duration_ms', 'duration_ms'),
+    ('error_type', 'error_type'),
+    ('validation_status', 'validation_status'),
+)
+_EXTRA_FIELDS = tuple(
+    (attr_name, _encode_json_str(key) + ': ') for attr_name, key in _EXTRA_KEYS
+)
+
+_MISSING = object()
+
+
 class LoanGuardFormatter(logging.Formatter):
     """Custom formatter for LoanGuard logging with structured output."""
     
     def format(self, record):
         """Format log record with structured information."""
-        # Create structured log entry
-        log_entry = {
-            'timestamp': datetime.fromtimestamp(record.created).isoformat(),
-            'level': record.levelname,
-            'module': record.module,
-            'function': record.funcName,
-            'line': record.lineno,
-            'message': record.getMessage()
-        }
+        # Create structured log entry; the fixed fields are written straight into
+        # the JSON text instead of being collected into a dict for json.dumps
+        log_json = (
+            f'{{"timestamp": {_encode_json_str(datetime.fromtimestamp(record.created).isoformat())}, '
+            f'"level": {_encode_json_str(record.levelname)}, '
+            f'"module": {_encode_json_str(record.module)}, '
+            f'"function": {_json_value(record.funcName)}, '
+            f'"line": {_json_value(record.lineno)}, '
+            f'"message": {_encode_json_str(record.getMessage())}'
+        )
         
-        # Add extra fields if present
-        if hasattr(record, 'user_session'):
-            log_entry['user_session'] = record.user_session
-        if hasattr(record, 'loan_file_name'):
-            log_entry['file_name'] = record.loan_file_name
-        if hasattr(record, 'loan_operation'):
-            log_entry['operation'] = record.loan_operation
-        if hasattr(record, 'duration_ms'):
-            log_entry['duration_ms'] = record.duration_ms
-        if hasattr(record, 'error_type'):
-            log_entry['error_type'] = record.error_type
-        if hasattr(record, 'validation_status'):
-            log_entry['validation_status'] = record.validation_status
+        # Add extra fields if present; a single dict lookup each, since none of
+        # these names are LogRecord class attributes that hasattr() would also find
+        record_dict = record.__dict__
+        extra_fields = []
+        for attr_name, json_prefix in _EXTRA_FIELDS:
+            value = record_dict.get(attr_name, _MISSING)
+            if value is not _MISSING:
+                extra_fields.append(json_prefix + _json_value(value))
+        
+        # Render the traceback only when a handler actually formats the record;
+        # records that crossed the log queue carry it pre-rendered in exc_text
+        if record.exc_info:
+            extra_fields.append('"exception": ' + _encode_json_str(self.formatException(record.exc_info)))
+        elif record.exc_text:
+            extra_fields.append('"exception": ' + _encode_json_str(record.exc_text))
+
+        if extra_fields:
+            return log_json + ', ' + ', '.join(extra_fields) + '}'
+        return log_json + '}'
+
+
+class _LoanGuardQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that keeps records in the shape LoanGuardFormatter expects."""
+    
+    def prepare(self, record):
+        """
+        Make a record safe to hand to the listener thread.
         
-        # Format as JSON for structured logging
-        return json.dumps(log_entry, default=str)
+        The stock prepare() folds the traceback into the message and drops exc_info,
+        which would move it out of the "exception" field. Here only the message
+        arguments are merged and the traceback is rendered into exc_text, so the
+        record no longer holds frames or mutable argument objects.
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+_FORMATTER = LoanGuardFormatter()
+
+# Background thread that owns the real handlers; replaced on every setup_logging()
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_log_listener() -> None:
+    """Flush queued records and close the handlers owned by the current listener."""
+    global _log_listener
+    if _log_listener is None:
+        return
+    _log_listener.stop()
+    for handler in _log_listener.handlers:
+        handler.close()
+    _log_listener = None
+
+
+atexit.register(_stop_log_listener)
 
 
 def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None) -> logging.Logger:
@@ -59,21 +140,24 @@ def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None) -> lo
     Returns:
         logging.Logger: Configured logger instance
     """
+    global _log_listener
+    
     # Create logger
     logger = logging.getLogger('loanguard')
     logger.setLevel(getattr(logging, log_level.upper()))
     
-    # Clear existing handlers
+    # Clear existing handlers (and drain the listener that owned them)
     logger.handlers.clear()
+    _stop_log_listener()
     
     # Create formatter
-    formatter = LoanGuardFormatter()
+    formatter = _FORMATTER
     
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers = [console_handler]
     
     # File handler (if specified)
     if log_file:
@@ -90,7 +174,14 @@ def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None) -> lo
         )
         file_handler.setLevel(getattr(logging, log_level.upper()))
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    # Logging calls only enqueue the record; formatting and console/file I/O run
+    # on the listener thread
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(_LoanGuardQueueHandler(log_queue))
+    _log_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _log_listener.start()
     
     # Prevent propagation to root logger
     logger.propagate = False
@@ -111,21 +202,8 @@ def get_logger(name: str = 'loanguard') -> logging.Logger:
     return logging.getLogger(name)
 
 
-class LoggingContext:
-    """Context manager for adding structured logging context."""
-    
-    def __init__(self, logger: logging.Logger, **context):
-        self.logger = logger
-        self.context = context
-        self.old_factory = logging.getLogRecordFactory()
-    
-    def __enter__(self):
-        # Temporarily disable custom logging context to avoid LogRecord conflicts
-        return self
-    
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        # No-op for now
-        pass
+# The application logger; setup_logging() reconfigures this same object in place
+_LOGGER = get_logger()
 
 
 def log_operation(operation_name: str):
@@ -136,27 +214,31 @@ def log_operation(operation_name: str):
         operation_name: Name of the operation being logged
     """
     def decorator(func):
+        # Resolved once per decorated function rather than on every call
+        logger = _LOGGER
+        
         def wrapper(*args, **kwargs):
-            logger = get_logger()
-            start_time = datetime.now()
+            start_time = perf_counter()
             
             try:
-                with LoggingContext(logger, loan_operation=operation_name):
-                    logger.info(f"Starting operation: {operation_name}")
-                    result = func(*args, **kwargs)
-                    
-                    duration = (datetime.now() - start_time).total_seconds() * 1000
+                logger.info("Starting operation: %s", operation_name,
+                            extra={'loan_operation': operation_name})
+                result = func(*args, **kwargs)
+                
+                if logger.isEnabledFor(logging.INFO):
+                    duration = (perf_counter() - start_time) * 1000.0
                     logger.info(
-                        f"Operation completed successfully: {operation_name}",
-                        extra={'duration_ms': duration}
+                        "Operation completed successfully: %s", operation_name,
+                        extra={'loan_operation': operation_name, 'duration_ms': duration}
                     )
-                    return result
+                return result
                     
             except Exception as e:
-                duration = (datetime.now() - start_time).total_seconds() * 1000
+                duration = (perf_counter() - start_time) * 1000.0
                 logger.error(
-                    f"Operation failed: {operation_name} - {str(e)}",
+                    "Operation failed: %s - %s", operation_name, e,
                     extra={
+                        'loan_operation': operation_name,
                         'duration_ms': duration,
                         'error_type': type(e).__name__
                     },
@@ -176,7 +258,9 @@ def log_validation_result(validation_result, file_name: str = None):
         validation_result: ValidationResult object
         file_name: Name of the processed file
     """
-    logger = get_logger()
+    logger = _LOGGER
+    if not logger.isEnabledFor(logging.INFO):
+        return
     
     extra_info = {
         'operation': 'validation',
@@ -189,7 +273,8 @@ def log_validation_result(validation_result, file_name: str = None):
         extra_info['loan_file_name'] = file_name
     
     logger.info(
-        f"Validation {validation_result.status} - difference: ${validation_result.difference_amount:.2f}"
+        "Validation %s - difference: $%.2f",
+        validation_result.status, validation_result.difference_amount
     )
 
 
@@ -201,7 +286,9 @@ def log_extraction_result(extracted_data, file_name: str = None):
         extracted_data: ExtractedData object
         file_name: Name of the processed file
     """
-    logger = get_logger()
+    logger = _LOGGER
+    if not logger.isEnabledFor(logging.INFO):
+        return
     
     # Count extracted fields
     fields_extracted = sum(1 for field in [
@@ -226,7 +313,7 @@ def log_extraction_result(extracted_data, file_name: str = None):
         extra_info['avg_confidence'] = avg_confidence
     
     logger.info(
-        f"Data extraction completed - {fields_extracted}/5 fields extracted"
+        "Data extraction completed - %d/5 fields extracted", fields_extracted
     )
 
 
@@ -238,7 +325,9 @@ def log_calculation_result(calculation_result, file_name: str = None):
         calculation_result: CalculationResult object
         file_name: Name of the processed file
     """
-    logger = get_logger()
+    logger = _LOGGER
+    if not logger.isEnabledFor(logging.INFO):
+        return
     
     extra_info = {
         'operation': 'calculation',
@@ -250,7 +339,7 @@ def log_calculation_result(calculation_result, file_name: str = None):
         extra_info['loan_file_name'] = file_name
     
     logger.info(
-        f"Interest calculation completed - amount: ${calculation_result.expected_interest:.2f}"
+        "Interest calculation completed - amount: $%.2f", calculation_result.expected_interest
     )
 
 
@@ -264,7 +353,7 @@ def log_error(error: Exception, operation: str, file_name: str = None, **context
         file_name: Name of the file being processed (if applicable)
         **context: Additional context information
     """
-    logger = get_logger()
+    logger = _LOGGER
     
     extra_info = {
         'operation_name': operation,
@@ -276,7 +365,7 @@ def log_error(error: Exception, operation: str, file_name: str = None, **context
         extra_info['loan_file_name'] = file_name
     
     logger.error(
-        f"Error in {operation}: {str(error)}",
+        "Error in %s: %s", operation, error,
         exc_info=True
     )
 
@@ -4,47 +4,53 @@ Basic tests for the LoanGuard application setup.
 
 import pytest
 from unittest.mock import Mock
-from app import validate_pdf_file
+from app import validate_pdf_file, _pdf_failure_reason
 
-def test_validate_pdf_file_with_valid_pdf():
-    """Test PDF validation with a valid PDF file."""
-    # Mock a valid PDF file
-    mock_file = Mock()
-    mock_file.name = "test_document.pdf"
-    mock_file.type = "application/pdf"
-    
-    result = validate_pdf_file(mock_file)
-    assert result is True
+# (file name, MIME type, expected result); a None name stands for no upload at all
+PDF_VALIDATION_CASES = [
+    ("test_document.pdf", "application/pdf", True),   # valid PDF
+    ("test_document.txt", "text/plain", False),       # wrong extension
+    ("test_document.pdf", "text/plain", False),       # PDF extension, wrong MIME type
+    (None, None, False),                              # no file provided
+]
 
-def test_validate_pdf_file_with_invalid_extension():
-    """Test PDF validation with invalid file extension."""
-    # Mock a file with wrong extension
-    mock_file = Mock()
-    mock_file.name = "test_document.txt"
-    mock_file.type = "text/plain"
+@pytest.mark.parametrize(
+    "name,mime,expected",
+    PDF_VALIDATION_CASES,
+    ids=["valid_pdf", "invalid_extension", "invalid_mime_type", "none"]
+)
+def test_validate_pdf_file(name, mime, expected):
+    """Test PDF validation across valid, mismatched and missing uploads."""
+    if name is None:
+        mock_file = None
+    else:
+        mock_file = Mock()
+        mock_file.name = name
+        mock_file.type = mime
     
     result = validate_pdf_file(mock_file)
-    assert result is False
+    assert result is expected
 
-def test_validate_pdf_file_with_invalid_mime_type():
-    """Test PDF validation with invalid MIME type."""
-    # Mock a file with PDF extension but wrong MIME type
-    mock_file = Mock()
-    mock_file.name = "test_document.pdf"
-    mock_file.type = "text/plain"
-    
-    result = validate_pdf_file(mock_file)
-    assert result is False
+# (file name, MIME type, expected failure reason logged by validate_pdf_file)
+PDF_FAILURE_REASON_CASES = [
+    ("test_document.pdf", "application/pdf", None),
+    ("test_document.txt", "text/plain", "Invalid extension"),
+    ("test_document.pdf", "text/plain", "Invalid MIME type text/plain"),
+]
 
-def test_validate_pdf_file_with_none():
-    """Test PDF validation with None input."""
-    result = validate_pdf_file(None)
-    assert result is False
+@pytest.mark.parametrize(
+    "name,mime,expected",
+    PDF_FAILURE_REASON_CASES,
+    ids=["valid_pdf", "invalid_extension", "invalid_mime_type"]
+)
+def test_pdf_failure_reason(name, mime, expected):
+    """Test that each failed PDF check reports its own reason."""
+    assert _pdf_failure_reason(name, mime) == expected
 
 if __name__ == "__main__":
     # Run basic tests
-    test_validate_pdf_file_with_valid_pdf()
-    test_validate_pdf_file_with_invalid_extension()
-    test_validate_pdf_file_with_invalid_mime_type()
-    test_validate_pdf_file_with_none()
-    print("All basic tests passed!")
\ No newline at end of file
+    for case in PDF_VALIDATION_CASES:
+        test_validate_pdf_file(*case)
+    for case in PDF_FAILURE_REASON_CASES:
+        test_pdf_failure_reason(*case)
+    print("All basic tests passed!")
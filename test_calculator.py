@@ -8,8 +8,10 @@ from calculator import (
     calculate_interest,
     calculate_days,
     calculate_interest_with_details,
+    calculate_interest_batch,
     format_currency,
     validate_calculation_inputs,
+    validate_calculation_inputs_batch,
     calculate_tolerance,
     format_percentage,
     format_days,
@@ -27,6 +29,12 @@ def test_calculate_interest_basic():
     expected = 1000000 * 0.05 * 91 / 360
     assert abs(result - expected) < 0.01
 
+def test_calculate_interest_rounds_half_cent_up():
+    """Test exact half-cent interest rounds up rather than following float error."""
+    # 1002 × 0.05 × 30 / 360 = 4.175 exactly
+    result = calculate_interest(1002.0, 0.05, datetime(2024, 1, 1), datetime(2024, 1, 31))
+    assert result == 4.18
+
 def test_calculate_days():
     """Test day calculation between dates."""
     start = datetime(2024, 1, 1)
@@ -49,12 +57,37 @@ def test_calculate_interest_with_details():
     assert result.days_calculated == 31
     assert "360" in result.formula_used
 
-def test_format_currency():
+def test_calculate_interest_batch():
+    """Test batch interest calculation matches the single-loan calculation."""
+    principals = [1000000.0, 500000.0]
+    rates = [0.05, 0.04]
+    start_dates = [datetime(2024, 1, 1), datetime(2024, 1, 1)]
+    end_dates = [datetime(2024, 4, 1), datetime(2024, 2, 1)]
+    
+    result = calculate_interest_batch(principals, rates, start_dates, end_dates)
+    expected = [
+        calculate_interest(p, r, s, e)
+        for p, r, s, e in zip(principals, rates, start_dates, end_dates)
+    ]
+    assert result == expected
+    
+    # Mismatched lengths and invalid loans are rejected
+    with pytest.raises(ValueError):
+        calculate_interest_batch(principals, rates[:1], start_dates, end_dates)
+    with pytest.raises(ValueError):
+        calculate_interest_batch([-1.0], [0.05], [datetime(2024, 1, 1)], [datetime(2024, 2, 1)])
+
+CURRENCY_FORMAT_CASES = [
+    (1234567.89, "$1,234,567.89"),
+    (0, "$0.00"),
+    (-100, "-$100.00"),
+    (None, "N/A"),
+]
+
+@pytest.mark.parametrize("amount,expected", CURRENCY_FORMAT_CASES)
+def test_format_currency(amount, expected):
     """Test currency formatting."""
-    assert format_currency(1234567.89) == "$1,234,567.89"
-    assert format_currency(0) == "$0.00"
-    assert format_currency(-100) == "-$100.00"
-    assert format_currency(None) == "N/A"
+    assert format_currency(amount) == expected
 
 def test_validate_calculation_inputs():
     """Test input validation."""
@@ -82,36 +115,70 @@ def test_validate_calculation_inputs():
     )
     assert 'date_range' in errors
 
-def test_calculate_tolerance():
-    """Test tolerance calculation."""
-    # Small amount - should use $1 minimum
-    assert calculate_tolerance(100) == 1.0
+def test_validate_calculation_inputs_batch():
+    """Test batch input validation flags each error class per loan."""
+    flags = validate_calculation_inputs_batch(
+        [1000000.0, -5.0, 2_000_000_000.0],
+        [0.05, -0.01, 1.5],
+        [90, 0, 4000]
+    )
     
-    # Large amount - should use 0.01%
-    large_amount = 1000000
-    expected_tolerance = large_amount * 0.0001
-    assert calculate_tolerance(large_amount) == expected_tolerance
+    assert flags['principal_nonpos'] == [False, True, False]
+    assert flags['principal_huge'] == [False, False, True]
+    assert flags['rate_neg'] == [False, True, False]
+    assert flags['rate_high'] == [False, False, True]
+    assert flags['range_bad'] == [False, True, False]
+    assert flags['range_long'] == [False, False, True]
+
+TOLERANCE_CASES = [
+    (100, 1.0),                           # small amount - $1 minimum
+    (1000000, 1000000 * 0.0001),          # large amount - 0.01%
+    (0, 1.0),                             # zero - $1 minimum
+    (-100, 1.0),                          # negative - $1 minimum
+]
+
+@pytest.mark.parametrize("amount,expected", TOLERANCE_CASES)
+def test_calculate_tolerance(amount, expected):
+    """Test tolerance calculation."""
+    assert calculate_tolerance(amount) == expected
+
+PERCENTAGE_FORMAT_CASES = [
+    (0.0525, "5.2500%"),
+    (0.1, "10.0000%"),
+    (None, "N/A"),
+]
 
-def test_format_percentage():
+@pytest.mark.parametrize("rate,expected", PERCENTAGE_FORMAT_CASES)
+def test_format_percentage(rate, expected):
     """Test percentage formatting."""
-    assert format_percentage(0.0525) == "5.2500%"
-    assert format_percentage(0.1) == "10.0000%"
-    assert format_percentage(None) == "N/A"
+    assert format_percentage(rate) == expected
+
+DAYS_FORMAT_CASES = [
+    (1, "1 day"),
+    (30, "30 days"),
+    (None, "N/A"),
+]
 
-def test_format_days():
+@pytest.mark.parametrize("days,expected", DAYS_FORMAT_CASES)
+def test_format_days(days, expected):
     """Test days formatting."""
-    assert format_days(1) == "1 day"
-    assert format_days(30) == "30 days"
-    assert format_days(None) == "N/A"
+    assert format_days(days) == expected
 
 if __name__ == "__main__":
     # Run basic tests
     test_calculate_interest_basic()
+    test_calculate_interest_rounds_half_cent_up()
     test_calculate_days()
     test_calculate_interest_with_details()
-    test_format_currency()
+    test_calculate_interest_batch()
+    for case in CURRENCY_FORMAT_CASES:
+        test_format_currency(*case)
     test_validate_calculation_inputs()
-    test_calculate_tolerance()
-    test_format_percentage()
-    test_format_days()
+    test_validate_calculation_inputs_batch()
+    for case in TOLERANCE_CASES:
+        test_calculate_tolerance(*case)
+    for case in PERCENTAGE_FORMAT_CASES:
+        test_format_percentage(*case)
+    for case in DAYS_FORMAT_CASES:
+        test_format_days(*case)
     print("All calculator tests passed!")
\ No newline at end of file
@@ -3,7 +3,7 @@ Tests for the PDF extraction functionality.
 """
 
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, MagicMock, patch
 from extractor import (
     extract_loan_data, 
     parse_currency_amount, 
@@ -16,22 +16,22 @@ from extractor import (
 from datetime import datetime
 import io
 
-def test_parse_currency_amount():
+CURRENCY_AMOUNT_CASES = [
+    ("$1,234,567.89", 1234567.89),            # standard currency format
+    ("$1234567.89", 1234567.89),              # without commas
+    ("Principal: $5,000,000.00", 5000000.00), # with text context
+    ("No money here", None),                  # no valid currency
+    ("", None),                               # empty string
+]
+
+@pytest.mark.parametrize("text,expected", CURRENCY_AMOUNT_CASES)
+def test_parse_currency_amount(text, expected):
     """Test currency amount parsing with various formats."""
-    # Test standard currency format
-    assert parse_currency_amount("$1,234,567.89") == 1234567.89
-    
-    # Test without commas
-    assert parse_currency_amount("$1234567.89") == 1234567.89
-    
-    # Test with text context
-    assert parse_currency_amount("Principal: $5,000,000.00") == 5000000.00
-    
-    # Test with no valid currency
-    assert parse_currency_amount("No money here") is None
-    
-    # Test empty string
-    assert parse_currency_amount("") is None
+    result = parse_currency_amount(text)
+    if expected is None:
+        assert result is None
+    else:
+        assert result == expected
 
 def test_parse_percentage():
     """Test percentage parsing with various formats."""
@@ -92,29 +92,36 @@ def test_extract_interest_amount():
     result = extract_interest_amount(text)
     assert result is None
 
+@pytest.fixture
+def make_mock_pdf():
+    """Return a factory building a mock pdfplumber PDF with one page per given text."""
+    def _make(*texts):
+        mock_pages = []
+        for text in texts:
+            mock_page = Mock()
+            mock_page.extract_text.return_value = text
+            mock_pages.append(mock_page)
+        
+        # MagicMock supports the context-manager protocol used by pdfplumber.open
+        mock_pdf = MagicMock()
+        mock_pdf.pages = mock_pages
+        mock_pdf.__enter__.return_value = mock_pdf
+        return mock_pdf
+    return _make
+
 @patch('pdfplumber.open')
-def test_extract_loan_data_success(mock_pdf_open):
+def test_extract_loan_data_success(mock_pdf_open, make_mock_pdf):
     """Test successful data extraction from PDF."""
     # Mock PDF content
-    mock_page = Mock()
-    mock_page.extract_text.return_value = """
+    mock_pdf_open.return_value = make_mock_pdf("""
     Loan Interest Payment Notice
     Principal Amount: $1,000,000.00
     Interest Rate: 5.25%
     Start Date: 01/01/2024
     End Date: 03/31/2024
     Interest Amount: $13,125.00
-    """
-    
-    mock_pdf = Mock()
-    mock_pdf.pages = [mock_page]
-    mock_pdf.__enter__ = Mock(return_value=mock_pdf)
-    mock_pdf.__exit__ = Mock(return_value=None)
-    mock_pdf_open.return_value = mock_pdf
-    
-    # Mock file object
+    """)
     mock_file = Mock()
-    mock_file.seek = Mock()
     
     # Test extraction
     result = extract_loan_data(mock_file)
@@ -128,47 +135,27 @@ def test_extract_loan_data_success(mock_pdf_open):
     assert result.end_date == datetime(2024, 3, 31)
 
 @patch('pdfplumber.open')
-def test_extract_loan_data_empty_pdf(mock_pdf_open):
+def test_extract_loan_data_empty_pdf(mock_pdf_open, make_mock_pdf):
     """Test extraction from empty PDF."""
     # Mock empty PDF
-    mock_page = Mock()
-    mock_page.extract_text.return_value = ""
-    
-    mock_pdf = Mock()
-    mock_pdf.pages = [mock_page]
-    mock_pdf.__enter__ = Mock(return_value=mock_pdf)
-    mock_pdf.__exit__ = Mock(return_value=None)
-    mock_pdf_open.return_value = mock_pdf
-    
-    # Mock file object
+    mock_pdf_open.return_value = make_mock_pdf("")
     mock_file = Mock()
-    mock_file.seek = Mock()
     
     # Test extraction should raise exception
     with pytest.raises(Exception, match="No text could be extracted"):
         extract_loan_data(mock_file)
 
 @patch('pdfplumber.open')
-def test_extract_loan_data_partial_data(mock_pdf_open):
+def test_extract_loan_data_partial_data(mock_pdf_open, make_mock_pdf):
     """Test extraction with partial data available."""
     # Mock PDF with only some data
-    mock_page = Mock()
-    mock_page.extract_text.return_value = """
+    mock_pdf_open.return_value = make_mock_pdf("""
     Loan Document
     Principal Amount: $500,000.00
     Interest Rate: 4.5%
     Some other text without dates or interest amount
-    """
-    
-    mock_pdf = Mock()
-    mock_pdf.pages = [mock_page]
-    mock_pdf.__enter__ = Mock(return_value=mock_pdf)
-    mock_pdf.__exit__ = Mock(return_value=None)
-    mock_pdf_open.return_value = mock_pdf
-    
-    # Mock file object
+    """)
     mock_file = Mock()
-    mock_file.seek = Mock()
     
     # Test extraction
     result = extract_loan_data(mock_file)
@@ -181,9 +168,43 @@ def test_extract_loan_data_partial_data(mock_pdf_open):
     assert result.start_date is None  # Not found
     assert result.end_date is None  # Not found
 
+@patch('pdfplumber.open')
+def test_extract_loan_data_multi_page(mock_pdf_open, make_mock_pdf):
+    """Test that keyword-anchored values on a later page win over page-one fallbacks."""
+    # Page one only offers fallback candidates: a largest dollar figure and bare dates
+    mock_pdf = make_mock_pdf("""
+    Account Summary
+    Fee paid: $5,000.00
+    Posted 02/01/2023 and 02/15/2023
+    """, """
+    Principal Amount: $1,000,000.00
+    Interest Rate: 5.25%
+    Start Date: 01/01/2024
+    End Date: 03/31/2024
+    Interest Amount: $13,125.00
+    """, """
+    Appendix
+    """)
+    mock_pdf_open.return_value = mock_pdf
+    mock_file = Mock()
+    
+    # Test extraction
+    result = extract_loan_data(mock_file)
+    
+    # Verify the page-two values were chosen
+    assert result.principal_amount == 1000000.00
+    assert result.interest_rate == 0.0525
+    assert result.notice_interest_amount == 13125.00
+    assert result.start_date == datetime(2024, 1, 1)
+    assert result.end_date == datetime(2024, 3, 31)
+    
+    # Every field was anchored by page two, so page three is never read
+    mock_pdf.pages[2].extract_text.assert_not_called()
+
 if __name__ == "__main__":
     # Run tests
-    test_parse_currency_amount()
+    for case in CURRENCY_AMOUNT_CASES:
+        test_parse_currency_amount(*case)
     test_parse_percentage()
     test_parse_date()
     test_extract_dates()
@@ -0,0 +1,85 @@
+"""
+Tests for the input validation functionality.
+"""
+
+import pickle
+import pytest
+from datetime import datetime
+from input_validator import (
+    ValidationError,
+    perform_comprehensive_validation,
+    validate_batch
+)
+from extractor import ExtractedData
+
+
+def make_record(**overrides):
+    """Build an ExtractedData record that passes every check, with the given fields replaced."""
+    record = ExtractedData()
+    record.principal_amount = 1000000.00
+    record.interest_rate = 0.0525
+    record.start_date = datetime(2024, 1, 2)   # Tuesday
+    record.end_date = datetime(2024, 3, 29)    # Friday
+    record.notice_interest_amount = 13125.00
+    record.extraction_confidence = {'principal': 0.8, 'rate': 0.8, 'dates': 0.7, 'interest_amount': 0.8}
+    for field, value in overrides.items():
+        setattr(record, field, value)
+    return record
+
+# (case id, record) pairs covering clean records, records on the thresholds
+# validate_batch screens against, and records with missing data
+BATCH_CASES = [
+    ("clean", make_record()),
+    ("clean_no_confidence", make_record(extraction_confidence={})),
+    ("weekend_start_date", make_record(start_date=datetime(2024, 1, 6))),
+    ("weekend_end_date", make_record(end_date=datetime(2024, 3, 31))),
+    ("period_730_days", make_record(end_date=datetime(2026, 1, 1))),
+    ("period_731_days", make_record(end_date=datetime(2026, 1, 2))),
+    ("interest_ratio_0_5", make_record(notice_interest_amount=500000.00)),
+    ("interest_ratio_over_0_5", make_record(notice_interest_amount=500001.00)),
+    ("confidence_0_5", make_record(extraction_confidence={'principal': 0.5})),
+    ("low_confidence", make_record(extraction_confidence={'principal': 0.8, 'dates': 0.49})),
+    ("missing_principal", make_record(principal_amount=None)),
+    ("missing_dates", make_record(start_date=None, end_date=None)),
+    ("missing_interest_amount", make_record(notice_interest_amount=None)),
+    ("all_fields_missing", ExtractedData()),
+    ("none", None),
+]
+
+
+def test_validation_error_suggestion_defaults_to_none():
+    """Test that ValidationError can be built without a suggestion."""
+    error = ValidationError("principal_amount", "Principal amount is required", "error")
+    
+    assert error.suggestion is None
+
+def test_validation_error_is_slotted_and_picklable():
+    """Test that slotted ValidationError instances round-trip through pickle."""
+    error = ValidationError("interest_rate", "Interest rate is required", "error", suggestion="Check the PDF")
+    
+    assert not hasattr(error, '__dict__')
+    assert pickle.loads(pickle.dumps(error)) == error
+
+@pytest.mark.parametrize(
+    "record",
+    [record for _, record in BATCH_CASES],
+    ids=[case_id for case_id, _ in BATCH_CASES]
+)
+def test_validate_batch_matches_comprehensive_validation(record):
+    """Test that validate_batch gives the same result as validating the record on its own."""
+    assert validate_batch([record]) == [perform_comprehensive_validation(record)]
+
+def test_validate_batch_preserves_order():
+    """Test that validate_batch returns one result per record, in input order."""
+    records = [record for _, record in BATCH_CASES]
+    
+    assert validate_batch(records) == [perform_comprehensive_validation(record) for record in records]
+
+if __name__ == "__main__":
+    # Run basic tests
+    test_validation_error_suggestion_defaults_to_none()
+    test_validation_error_is_slotted_and_picklable()
+    for _, record in BATCH_CASES:
+        test_validate_batch_matches_comprehensive_validation(record)
+    test_validate_batch_preserves_order()
+    print("All input validator tests passed!")
@@ -7,6 +7,7 @@ from datetime import datetime
 from validator import (
     calculate_tolerance,
     validate_interest_calculation,
+    validate_interest_calculation_batch,
     generate_validation_summary,
     get_validation_recommendations,
     format_validation_for_display,
@@ -14,6 +15,7 @@ from validator import (
     can_perform_validation,
     ValidationResult
 )
+import calculator
 from calculator import CalculationResult
 from extractor import ExtractedData
 
@@ -42,19 +44,9 @@ def create_sample_calculation_result():
         }
     )
 
-def test_calculate_tolerance():
-    """Test tolerance calculation."""
-    # Small amount - should use $1 minimum
-    assert calculate_tolerance(100) == 1.0
-    
-    # Large amount - should use 0.01%
-    large_amount = 1000000
-    expected_tolerance = large_amount * 0.0001
-    assert calculate_tolerance(large_amount) == expected_tolerance
-    
-    # Zero or negative - should use $1
-    assert calculate_tolerance(0) == 1.0
-    assert calculate_tolerance(-100) == 1.0
+def test_calculate_tolerance_is_shared():
+    """Test that the validator uses the calculator's tolerance function (tested in test_calculator)."""
+    assert calculate_tolerance is calculator.calculate_tolerance
 
 def test_validate_interest_calculation_pass():
     """Test validation with matching amounts (PASS)."""
@@ -92,6 +84,30 @@ def test_validate_interest_calculation_missing_data():
     with pytest.raises(ValueError, match="Notice interest amount is required"):
         validate_interest_calculation(extracted_data, calculation_result)
 
+def test_validate_interest_calculation_batch():
+    """Test batch validation matches the single-notice comparison."""
+    expected = [12638.89, 12638.89, 100.0, 0.0]
+    notice = [12639.50, 12700.00, 102.0, 0.5]
+    
+    result = validate_interest_calculation_batch(expected, notice)
+    assert result['passed'] == [True, False, False, True]
+    
+    for i, (expected_amount, notice_amount) in enumerate(zip(expected, notice)):
+        extracted_data = create_sample_extracted_data()
+        extracted_data.notice_interest_amount = notice_amount
+        calculation_result = create_sample_calculation_result()
+        calculation_result.expected_interest = expected_amount
+        
+        single = validate_interest_calculation(extracted_data, calculation_result)
+        assert result['difference'][i] == single.difference_amount
+        assert result['percentage'][i] == single.percentage_difference
+        assert result['tolerance'][i] == single.tolerance_used
+        assert result['passed'][i] == (single.status == "PASS")
+    
+    # Mismatched lengths are rejected
+    with pytest.raises(ValueError):
+        validate_interest_calculation_batch(expected, notice[:1])
+
 def test_generate_validation_summary():
     """Test validation summary generation."""
     extracted_data = create_sample_extracted_data()
@@ -176,9 +192,10 @@ def test_can_perform_validation():
 
 if __name__ == "__main__":
     # Run basic tests
-    test_calculate_tolerance()
+    test_calculate_tolerance_is_shared()
     test_validate_interest_calculation_pass()
     test_validate_interest_calculation_fail()
+    test_validate_interest_calculation_batch()
     test_generate_validation_summary()
     test_get_validation_recommendations_pass()
     test_get_validation_recommendations_fail()
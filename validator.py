@@ -6,15 +6,21 @@ against notice interest amounts. It provides tolerance calculations, comparison
 logic, and clear pass/fail messaging for banking-grade validation.
 """
 
+import functools
 from dataclasses import dataclass
-from typing import Optional
-from calculator import CalculationResult
+from typing import Optional, Sequence
+from calculator import CalculationResult, calculate_tolerance
 from extractor import ExtractedData
 
 
 @dataclass
 class ValidationResult:
     """Data class to hold validation results and detailed explanations."""
+    __slots__ = (
+        'status', 'difference_amount', 'percentage_difference', 'message',
+        'detailed_explanation', 'tolerance_used', 'expected_amount', 'notice_amount'
+    )
+    
     status: str  # "PASS" or "FAIL"
     difference_amount: float
     percentage_difference: float
@@ -25,27 +31,41 @@ class ValidationResult:
     notice_amount: float
 
 
-def calculate_tolerance(amount: float) -> float:
+def _core_validate(expected: float, notice: float, tolerance: float) -> tuple[float, bool]:
+    """Return the absolute difference and whether it falls within tolerance."""
+    difference = abs(expected - notice)
+    return difference, difference <= tolerance
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_explanation(direction: Optional[str], difference: float, tolerance: float) -> str:
     """
-    Calculate acceptable tolerance for interest amount comparison.
+    Build the detailed explanation text for a validation outcome.
     
-    Uses the larger of $1.00 or 0.01% of the amount as tolerance,
-    following standard banking practices for interest validation.
+    Cached on the exact amounts, so re-validating the same notice (reruns, retries)
+    reuses the string; keying on rounded cents could disagree with the ``:.2f``
+    rendering at half-cent boundaries.
     
     Args:
-        amount: Interest amount to calculate tolerance for
+        direction: None for a pass, otherwise "more" or "less" (notice vs expected)
+        difference: Absolute difference between expected and notice amounts
+        tolerance: Tolerance the difference was compared against
         
     Returns:
-        float: Tolerance amount in dollars
+        str: Explanation text for ValidationResult.detailed_explanation
     """
-    if amount <= 0:
-        return 1.0  # Minimum $1 tolerance for edge cases
-    
-    # Calculate 0.01% of amount (1 basis point)
-    percentage_tolerance = amount * 0.0001
+    if direction is None:
+        return (
+            f"The interest calculation in the notice matches our expected calculation "
+            f"within acceptable tolerance. The difference of ${difference:.2f} is within "
+            f"the acceptable tolerance of ${tolerance:.2f}."
+        )
     
-    # Return the larger of $1 or 0.01%
-    return max(1.0, percentage_tolerance)
+    return (
+        f"The notice shows ${difference:.2f} {direction} than expected. "
+        f"This difference of ${difference:.2f} exceeds the acceptable tolerance "
+        f"of ${tolerance:.2f}. Please review the interest calculation in the notice."
+    )
 
 
 def validate_interest_calculation(extracted_data: ExtractedData, calculation_result: CalculationResult) -> ValidationResult:
@@ -62,52 +82,33 @@ def validate_interest_calculation(extracted_data: ExtractedData, calculation_res
     Raises:
         ValueError: If required data is missing for validation
     """
-    # Validate inputs
-    if calculation_result is None or calculation_result.expected_interest is None:
+    # Validate inputs (each amount is read once and reused below)
+    expected = None if calculation_result is None else calculation_result.expected_interest
+    if expected is None:
         raise ValueError("Calculation result is required for validation")
     
-    if extracted_data is None or extracted_data.notice_interest_amount is None:
+    notice = None if extracted_data is None else extracted_data.notice_interest_amount
+    if notice is None:
         raise ValueError("Notice interest amount is required for validation")
     
-    expected = calculation_result.expected_interest
-    notice = extracted_data.notice_interest_amount
-    
-    # Calculate difference metrics
-    difference = abs(expected - notice)
-    percentage_diff = (difference / expected * 100) if expected > 0 else 0
-    
-    # Calculate tolerance
+    # Calculate tolerance and difference metrics
     tolerance = calculate_tolerance(expected)
+    difference, within_tolerance = _core_validate(expected, notice, tolerance)
+    percentage_diff = (difference / expected * 100) if expected > 0 else 0
     
     # Determine validation status
-    if difference <= tolerance:
+    if within_tolerance:
         # PASS result
         status = "PASS"
         message = "Notice is Correct"
-        detailed_explanation = (
-            f"The interest calculation in the notice matches our expected calculation "
-            f"within acceptable tolerance. The difference of ${difference:.2f} is within "
-            f"the acceptable tolerance of ${tolerance:.2f}."
-        )
+        direction = None
     else:
         # FAIL result
         status = "FAIL"
         message = "Issue Detected"
-        
-        if notice > expected:
-            direction = "more"
-            detailed_explanation = (
-                f"The notice shows ${difference:.2f} more than expected. "
-                f"This difference of ${difference:.2f} exceeds the acceptable tolerance "
-                f"of ${tolerance:.2f}. Please review the interest calculation in the notice."
-            )
-        else:
-            direction = "less"
-            detailed_explanation = (
-                f"The notice shows ${difference:.2f} less than expected. "
-                f"This difference of ${difference:.2f} exceeds the acceptable tolerance "
-                f"of ${tolerance:.2f}. Please review the interest calculation in the notice."
-            )
+        direction = "more" if notice > expected else "less"
+    
+    detailed_explanation = _format_explanation(direction, difference, tolerance)
     
     return ValidationResult(
         status=status,
@@ -121,6 +122,54 @@ def validate_interest_calculation(extracted_data: ExtractedData, calculation_res
     )
 
 
+def validate_interest_calculation_batch(expected: Sequence[float], notice: Sequence[float]) -> dict[str, list]:
+    """
+    Compare many calculated vs reported interest amounts in a single pass.
+    
+    Produces the same numbers validate_interest_calculation would for each pair,
+    without building a ValidationResult or its explanation text; callers format
+    messages only for the rows they need.
+    
+    Args:
+        expected: Calculated interest amounts
+        notice: Interest amounts reported in the notices
+        
+    Returns:
+        dict[str, list]: Parallel lists keyed by 'difference', 'percentage',
+        'tolerance' and 'passed', in input order
+        
+    Raises:
+        ValueError: If the sequences differ in length
+    """
+    if len(expected) != len(notice):
+        raise ValueError("Expected and notice amounts must have the same length")
+    
+    tolerance_for = calculate_tolerance
+    differences = []
+    percentages = []
+    tolerances = []
+    passed = []
+    
+    for expected_amount, notice_amount in zip(expected, notice):
+        tolerance = tolerance_for(expected_amount)
+        difference = abs(expected_amount - notice_amount)
+        differences.append(difference)
+        percentages.append((difference / expected_amount * 100) if expected_amount > 0 else 0)
+        tolerances.append(tolerance)
+        passed.append(difference <= tolerance)
+    
+    return {
+        'difference': differences,
+        'percentage': percentages,
+        'tolerance': tolerances,
+        'passed': passed
+    }
+
+
+_SUMMARY_PASS_HEADER = "✅ VALIDATION PASSED\nThe interest notice calculation is correct."
+_SUMMARY_FAIL_HEADER = "❌ VALIDATION FAILED\nThe interest notice calculation contains an error."
+
+
 def generate_validation_summary(validation_result: ValidationResult) -> str:
     """
     Generate a comprehensive validation summary for display.
@@ -131,31 +180,54 @@ def generate_validation_summary(validation_result: ValidationResult) -> str:
     Returns:
         str: Formatted summary text for user display
     """
-    summary_lines = []
-    
     # Status header
     if validation_result.status == "PASS":
-        summary_lines.append("✅ VALIDATION PASSED")
-        summary_lines.append("The interest notice calculation is correct.")
+        header = _SUMMARY_PASS_HEADER
     else:
-        summary_lines.append("❌ VALIDATION FAILED")
-        summary_lines.append("The interest notice calculation contains an error.")
-    
-    # Amount comparison
-    summary_lines.append("")
-    summary_lines.append("AMOUNT COMPARISON:")
-    summary_lines.append(f"Expected (Calculated): ${validation_result.expected_amount:,.2f}")
-    summary_lines.append(f"Notice (PDF):         ${validation_result.notice_amount:,.2f}")
-    summary_lines.append(f"Difference:           ${validation_result.difference_amount:,.2f}")
-    summary_lines.append(f"Percentage Diff:      {validation_result.percentage_difference:.2f}%")
-    summary_lines.append(f"Tolerance Used:       ${validation_result.tolerance_used:,.2f}")
-    
-    # Detailed explanation
-    summary_lines.append("")
-    summary_lines.append("EXPLANATION:")
-    summary_lines.append(validation_result.detailed_explanation)
-    
-    return "\n".join(summary_lines)
+        header = _SUMMARY_FAIL_HEADER
+    
+    # Amount comparison and detailed explanation, built as one string
+    return (
+        f"{header}\n"
+        f"\n"
+        f"AMOUNT COMPARISON:\n"
+        f"Expected (Calculated): ${validation_result.expected_amount:,.2f}\n"
+        f"Notice (PDF):         ${validation_result.notice_amount:,.2f}\n"
+        f"Difference:           ${validation_result.difference_amount:,.2f}\n"
+        f"Percentage Diff:      {validation_result.percentage_difference:.2f}%\n"
+        f"Tolerance Used:       ${validation_result.tolerance_used:,.2f}\n"
+        f"\n"
+        f"EXPLANATION:\n"
+        f"{validation_result.detailed_explanation}"
+    )
+
+
+# Percentage differences above which a failed notice gets an extra recommendation
+_SIGNIFICANT_PCT_DIFF = 5.0
+_MODERATE_PCT_DIFF = 1.0
+
+# Their recommendation lines, quoting the thresholds so the text cannot drift from them
+_SIGNIFICANT_DIFF_RECOMMENDATION = (
+    f"The difference is significant (>{_SIGNIFICANT_PCT_DIFF:g}%) - double-check all input values"
+)
+_MODERATE_DIFF_RECOMMENDATION = (
+    f"The difference is moderate (>{_MODERATE_PCT_DIFF:g}%) - review calculation methodology"
+)
+
+# Fixed recommendation lines; get_validation_recommendations() returns a fresh
+# list built from these so callers may still modify the result
+_PASS_RECOMMENDATIONS = (
+    "The notice is ready to be sent to lenders",
+    "No further action required for this interest calculation",
+    "Consider archiving this validation result for audit purposes"
+)
+
+_FAIL_RECOMMENDATIONS = (
+    "Review the interest calculation in the notice before sending",
+    "Verify that the principal amount, interest rate, and dates are correct",
+    "Check for any special terms or adjustments that might affect the calculation",
+    "Consider recalculating the interest using the extracted data"
+)
 
 
 def get_validation_recommendations(validation_result: ValidationResult) -> list[str]:
@@ -168,37 +240,48 @@ def get_validation_recommendations(validation_result: ValidationResult) -> list[
     Returns:
         list[str]: List of recommendation strings
     """
-    recommendations = []
-    
     if validation_result.status == "PASS":
-        recommendations.extend([
-            "The notice is ready to be sent to lenders",
-            "No further action required for this interest calculation",
-            "Consider archiving this validation result for audit purposes"
-        ])
+        return list(_PASS_RECOMMENDATIONS)
+    
+    recommendations = list(_FAIL_RECOMMENDATIONS)
+    
+    # Add specific recommendations based on difference magnitude
+    if validation_result.percentage_difference > _SIGNIFICANT_PCT_DIFF:
+        recommendations.append(_SIGNIFICANT_DIFF_RECOMMENDATION)
+    elif validation_result.percentage_difference > _MODERATE_PCT_DIFF:
+        recommendations.append(_MODERATE_DIFF_RECOMMENDATION)
+    
+    # Add recommendations based on direction of error
+    if validation_result.notice_amount > validation_result.expected_amount:
+        recommendations.append("The notice amount is higher than expected - check for additional fees or adjustments")
     else:
-        recommendations.extend([
-            "Review the interest calculation in the notice before sending",
-            "Verify that the principal amount, interest rate, and dates are correct",
-            "Check for any special terms or adjustments that might affect the calculation",
-            "Consider recalculating the interest using the extracted data"
-        ])
-        
-        # Add specific recommendations based on difference magnitude
-        if validation_result.percentage_difference > 5.0:
-            recommendations.append("The difference is significant (>5%) - double-check all input values")
-        elif validation_result.percentage_difference > 1.0:
-            recommendations.append("The difference is moderate (>1%) - review calculation methodology")
-        
-        # Add recommendations based on direction of error
-        if validation_result.notice_amount > validation_result.expected_amount:
-            recommendations.append("The notice amount is higher than expected - check for additional fees or adjustments")
-        else:
-            recommendations.append("The notice amount is lower than expected - check for missing interest components")
+        recommendations.append("The notice amount is lower than expected - check for missing interest components")
     
     return recommendations
 
 
+# Static part of format_validation_for_display() output; None marks per-result values
+_PASS_DISPLAY_TEMPLATE = {
+    "status_color": "success",
+    "status_icon": "🟢",
+    "status_text": "PASS",
+    "status_message": None,
+    "card_style": "success",
+    "explanation": None,
+    "recommendations": None
+}
+
+_FAIL_DISPLAY_TEMPLATE = {
+    "status_color": "error",
+    "status_icon": "🔴",
+    "status_text": "FAIL",
+    "status_message": None,
+    "card_style": "error",
+    "explanation": None,
+    "recommendations": None
+}
+
+
 def format_validation_for_display(validation_result: ValidationResult) -> dict:
     """
     Format validation result for UI display with proper styling information.
@@ -209,26 +292,16 @@ def format_validation_for_display(validation_result: ValidationResult) -> dict:
     Returns:
         dict: Dictionary containing formatted display information
     """
+    # Copy the static styling and fill in the per-result values; the templates
+    # already hold every key, so the output keeps its key order
     if validation_result.status == "PASS":
-        return {
-            "status_color": "success",
-            "status_icon": "🟢",
-            "status_text": "PASS",
-            "status_message": validation_result.message,
-            "card_style": "success",
-            "explanation": validation_result.detailed_explanation,
-            "recommendations": get_validation_recommendations(validation_result)
-        }
+        display = _PASS_DISPLAY_TEMPLATE.copy()
     else:
-        return {
-            "status_color": "error",
-            "status_icon": "🔴",
-            "status_text": "FAIL",
-            "status_message": validation_result.message,
-            "card_style": "error",
-            "explanation": validation_result.detailed_explanation,
-            "recommendations": get_validation_recommendations(validation_result)
-        }
+        display = _FAIL_DISPLAY_TEMPLATE.copy()
+    display["status_message"] = validation_result.message
+    display["explanation"] = validation_result.detailed_explanation
+    display["recommendations"] = get_validation_recommendations(validation_result)
+    return display
 
 
 def validate_extracted_data_completeness(extracted_data: ExtractedData) -> dict[str, str]:
@@ -247,30 +320,36 @@ def validate_extracted_data_completeness(extracted_data: ExtractedData) -> dict[
         errors['general'] = "No extracted data available"
         return errors
     
+    principal = extracted_data.principal_amount
+    rate = extracted_data.interest_rate
+    start_date = extracted_data.start_date
+    end_date = extracted_data.end_date
+    notice_amount = extracted_data.notice_interest_amount
+    
     # Check required fields
-    if extracted_data.principal_amount is None:
+    if principal is None:
         errors['principal'] = "Principal amount not found in PDF"
-    elif extracted_data.principal_amount <= 0:
+    elif principal <= 0:
         errors['principal'] = "Principal amount must be positive"
     
-    if extracted_data.interest_rate is None:
+    if rate is None:
         errors['rate'] = "Interest rate not found in PDF"
-    elif extracted_data.interest_rate < 0:
+    elif rate < 0:
         errors['rate'] = "Interest rate cannot be negative"
     
-    if extracted_data.start_date is None:
+    if start_date is None:
         errors['start_date'] = "Start date not found in PDF"
     
-    if extracted_data.end_date is None:
+    if end_date is None:
         errors['end_date'] = "End date not found in PDF"
     
-    if extracted_data.start_date and extracted_data.end_date:
-        if extracted_data.start_date >= extracted_data.end_date:
+    if start_date and end_date:
+        if start_date >= end_date:
             errors['date_range'] = "Start date must be before end date"
     
-    if extracted_data.notice_interest_amount is None:
+    if notice_amount is None:
         errors['notice_amount'] = "Interest amount not found in PDF notice"
-    elif extracted_data.notice_interest_amount < 0:
+    elif notice_amount < 0:
         errors['notice_amount'] = "Interest amount cannot be negative"
     
     return errors